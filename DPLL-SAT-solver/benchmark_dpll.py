@@ -0,0 +1,103 @@
+# benchmark_dpll.py
+# Benchmarks dpll_basic over a folder of DIMACS files and writes one CSV row per file
+# (the format of dpll_results_sat.csv / dpll_results_unsat.csv)
+
+import csv
+import os
+import pickle
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+import dpll_basic
+
+RUNS_PER_FILE = 20
+CACHE_SUFFIX = ".pkl"  # parsed clauses cached next to each .cnf, redone when dpll_basic.py changes
+CSV_FIELDS = ["file", "recursive_calls", "unit_props", "pure_literals", "backtracks",
+              "avg_time_sec", "median_time_sec", "stdev_time_sec", "result"]
+
+# ------------------- PARSE CACHE -------------------
+def load_cnf(file_path: str) -> Tuple[List[List[int]], int]:
+    """parse_dimacs with an on-disk cache, reused while it is newer than the .cnf and the parser."""
+    cache_path = file_path + CACHE_SUFFIX
+    try:
+        if os.path.getmtime(cache_path) >= max(os.path.getmtime(file_path),
+                                               os.path.getmtime(dpll_basic.__file__)):
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # missing, stale or unreadable cache: parse again
+
+    parsed = dpll_basic.parse_dimacs(file_path)
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # read-only dataset folder: just skip caching
+    return parsed
+
+# ------------------- SINGLE FILE -------------------
+def run_dpll_on_file(file_path: str, runs: int = RUNS_PER_FILE) -> Dict[str, object]:
+    # Parsed and indexed once; every run shares the read-only Formula and only
+    # allocates its own search state
+    clauses, num_vars = load_cnf(file_path)
+    formula = dpll_basic.Formula(clauses, num_vars)
+
+    times = []
+    result = None
+    for _ in range(runs):
+        dpll_basic.stats.update(dict.fromkeys(dpll_basic.stats, 0))
+        start = time.perf_counter()
+        result = dpll_basic.solve_formula(formula, {})
+        times.append(time.perf_counter() - start)
+
+    counters = dpll_basic.stats
+    return {
+        "file": os.path.basename(file_path),
+        "recursive_calls": counters["calls"],
+        "unit_props": counters["unit_props"],
+        "pure_literals": counters["pure_literals"],
+        "backtracks": counters["backtracks"],
+        "avg_time_sec": round(statistics.mean(times), 6),
+        "median_time_sec": round(statistics.median(times), 6),
+        "stdev_time_sec": round(statistics.stdev(times), 6) if runs > 1 else 0.0,
+        "result": "UNSAT" if result is None else "SAT",
+    }
+
+# ------------------- FOLDER SWEEP -------------------
+def benchmark_folder(folder: str, out_csv: str, runs: int = RUNS_PER_FILE,
+                     workers: Optional[int] = None) -> List[Dict[str, object]]:
+    """Benchmark every .cnf in `folder`, one file per worker process.
+
+    Files are independent, so they are spread over a process pool (dpll_basic keeps
+    its counters in a module-level dict, which rules out threads). Rows are written
+    in file-name order regardless of completion order.
+    """
+    cnf_files = sorted(f for f in os.listdir(folder) if f.endswith(".cnf"))
+    rows = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        futures = {pool.submit(run_dpll_on_file, os.path.join(folder, name), runs): name
+                   for name in cnf_files}
+        for i, future in enumerate(as_completed(futures), 1):
+            name = futures[future]
+            row = rows[name] = future.result()
+            print(f"[{i}/{len(cnf_files)}] {name}: {row['result']} ({row['avg_time_sec']:.6f} sec)")
+
+    ordered = [rows[name] for name in cnf_files]
+    with open(out_csv, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        writer.writerows(ordered)
+    print(f"Saved {len(ordered)} results to '{out_csv}'")
+    return ordered
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("Usage: python benchmark_dpll.py <cnf_folder> <output.csv> [runs_per_file] [workers]")
+        sys.exit(1)
+
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else RUNS_PER_FILE
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else None
+    benchmark_folder(sys.argv[1], sys.argv[2], runs, workers)
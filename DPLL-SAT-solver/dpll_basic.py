@@ -1,10 +1,19 @@
 # dpll_basic.py
-# Basic DPLL SAT Solver (with unit propagation, pure literal elimination)
+# Basic DPLL SAT Solver (with unit propagation, pure literal elimination,
+# VSIDS branching)
 # + instrumentation: performance counters & timing
 
+import re
 import time
+from heapq import heapify, heappop, heappush
 from typing import List, Dict, Optional, Tuple
 
+# Optional native backend for solve(); the pure-Python DPLL below is the fallback
+try:
+    from pysat.solvers import Minisat22
+except ImportError:
+    Minisat22 = None
+
 # ------------------- GLOBAL COUNTERS -------------------
 stats = {
     "calls": 0,
@@ -14,142 +23,349 @@ stats = {
 }
 
 # ------------------- DIMACS PARSER -------------------
+HEADER_RE = re.compile(r"^p\s+cnf\s+(\d+)", re.MULTILINE)
+SKIP_LINE_RE = re.compile(r"^\s*[cp].*$", re.MULTILINE)
+END_LINE_RE = re.compile(r"^\s*%", re.MULTILINE)
+
 def parse_dimacs(file_path: str) -> Tuple[List[List[int]], int]:
-    clauses = []
-    num_vars = 0
+    """Parse in bulk: one read, one map(int) over the whole body, split at the 0s."""
     with open(file_path, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('c') or line == "" or line.startswith('%') or line.startswith('0'):
-                continue
-            if line.startswith('p'):
-                parts = line.split()
-                num_vars = int(parts[2])
-            else:
-                literals = [int(x) for x in line.split() if x != '0']
-                if literals:
-                    clauses.append(literals)
+        text = f.read()
+
+    header = HEADER_RE.search(text)
+    num_vars = int(header.group(1)) if header else 0
+
+    # SATLIB files end with a '%' line followed by a stray '0'; a '%' inside a comment
+    # is not that marker
+    body = SKIP_LINE_RE.sub("", END_LINE_RE.split(text, 1)[0])
+    literals = list(map(int, body.split()))
+
+    clauses = []
+    start = 0
+    while start < len(literals):
+        try:
+            end = literals.index(0, start)
+        except ValueError:
+            end = len(literals)  # last clause without its terminating 0
+        if end > start:
+            clauses.append(literals[start:end])
+        start = end + 1
     return clauses, num_vars
 
+# ------------------- SOLVER STATE -------------------
+# Per-literal state lives in flat lists of length 2*num_vars + 1 indexed directly by
+# the literal: lit in 1..n maps to itself, -lit wraps around to the upper half.
+# value[lit] is 1 (true), -1 (false) or 0 (unassigned).
+class Formula:
+    """Read-only clause database, built once and shared by every solve of the same CNF."""
+
+    def __init__(self, clauses: List[List[int]], num_vars: int = 0):
+        self.clauses = [list(dict.fromkeys(clause)) for clause in clauses]
+        self.num_vars = max(num_vars, max((abs(lit) for clause in self.clauses for lit in clause), default=0))
+        self.has_empty = any(not clause for clause in self.clauses)
+        self.units = [clause[0] for clause in self.clauses if len(clause) == 1]
+
+        size = 2 * self.num_vars + 1
+        self.occurs: List[List[int]] = [[] for _ in range(size)]
+        self.lit_count = [0] * size
+        for i, clause in enumerate(self.clauses):
+            for lit in clause:
+                self.occurs[lit].append(i)
+                self.lit_count[lit] += 1
+
+class SolverState:
+    """Search state shared by propagation, pure literal elimination and branching.
+
+    Clauses are never shrunk. Instead every assignment updates two counters:
+    sat_count[c], the number of true literals in clause c, and lit_count[lit], the
+    number of still-open clauses containing lit; open_count is the number of clauses
+    not yet satisfied. Only this per-run state is allocated per solve; occurrence
+    lists are shared with the Formula.
+    """
+
+    def __init__(self, formula: Formula):
+        size = 2 * formula.num_vars + 1
+        # Watched literals are kept in clause[0] and clause[1], which reorders literals
+        # in place, so each run takes its own (C-level) copy of the clause lists
+        self.clauses = [clause[:] for clause in formula.clauses]
+        self.num_vars = formula.num_vars
+        self.occurs = formula.occurs
+        self.lit_count = formula.lit_count[:]
+        self.sat_count = [0] * len(self.clauses)
+        self.open_count = len(self.clauses)
+        self.value = [0] * size
+        self.trail: List[int] = []
+
+        self.watches: List[List[int]] = [[] for _ in range(size)]
+        for i, clause in enumerate(self.clauses):
+            if len(clause) > 1:
+                self.watches[clause[0]].append(i)
+                self.watches[clause[1]].append(i)
+
+        # Literals whose open-clause count dropped to zero: their negation may be pure
+        self.pure_candidates = [lit for var in range(1, formula.num_vars + 1) for lit in (var, -var)]
+
+        # VSIDS scores and the lazy decision heap of (-activity, var) entries
+        self.activity = [0.0] * (formula.num_vars + 1)
+        self.var_inc = 1.0
+        self.order = [(-0.0, var) for var in range(1, formula.num_vars + 1)]
+        self.in_order = [False] + [True] * formula.num_vars
+
+def assign(state: SolverState, lit: int) -> None:
+    state.value[lit] = 1
+    state.value[-lit] = -1
+    state.trail.append(lit)
+
+    clauses, sat_count, lit_count = state.clauses, state.sat_count, state.lit_count
+    for ci in state.occurs[lit]:
+        count = sat_count[ci]
+        sat_count[ci] = count + 1
+        if not count:
+            state.open_count -= 1
+            for other in clauses[ci]:
+                count = lit_count[other] - 1  # clause leaves the open set
+                lit_count[other] = count
+                if not count:
+                    state.pure_candidates.append(other)
+
+def backtrack(state: SolverState, mark: int) -> None:
+    value, trail, occurs = state.value, state.trail, state.occurs
+    clauses, sat_count, lit_count = state.clauses, state.sat_count, state.lit_count
+    activity, order, in_order = state.activity, state.order, state.in_order
+    for _ in range(len(trail) - mark):
+        lit = trail.pop()
+        value[lit] = value[-lit] = 0
+        for ci in occurs[lit]:
+            count = sat_count[ci] - 1
+            sat_count[ci] = count
+            if not count:
+                state.open_count += 1
+                for other in clauses[ci]:
+                    lit_count[other] += 1  # clause is open again
+
+        var = abs(lit)
+        if not in_order[var]:
+            in_order[var] = True
+            heappush(order, (-activity[var], var))
+
 # ------------------- UNIT PROPAGATION -------------------
-def unit_propagate(clauses: List[List[int]], assignment: Dict[int, bool]) -> Tuple[List[List[int]], Dict[int, bool]]:
-    changed = True
-    while changed:
-        changed = False
-        unit_clauses = [c for c in clauses if len(c) == 1]
-        if not unit_clauses:
-            break
-        
-        for uc in unit_clauses:
-            lit = uc[0]
-            stats["unit_props"] += 1
-            val = (lit > 0)
-            var = abs(lit)
-            
-            # Check for conflict
-            if var in assignment and assignment[var] != val:
-                return [[]], assignment  # conflict
-            
-            if var not in assignment:  # Only assign if not already assigned
-                assignment[var] = val
-                changed = True
-                
-                # Simplify clauses
-                new_clauses = []
-                for clause in clauses:
-                    if lit in clause:
-                        continue  # clause satisfied, skip it
-                    elif -lit in clause:
-                        new_clause = [l for l in clause if l != -lit]
-                        if not new_clause:  # empty clause = conflict
-                            return [[]], assignment
-                        new_clauses.append(new_clause)
-                    else:
-                        new_clauses.append(clause[:])  # copy clause
-                clauses = new_clauses
-                break  # restart the loop after modification
-    
-    return clauses, assignment
+def unit_propagate(state: SolverState, head: int) -> Optional[List[int]]:
+    """Propagate trail[head:]; only clauses watching a falsified literal are visited.
+
+    Satisfied clauses are skipped on their sat_count marker. Leaving a false watch
+    there is safe: the satisfying literal sits no later on the trail than the falsified
+    one (or, for a pure literal, the clause was already satisfied when it was set),
+    so backtracking can never reopen the clause without also unassigning the watch.
+    Returns the falsified clause on conflict, None otherwise.
+    """
+    clauses, watches, value, trail = state.clauses, state.watches, state.value, state.trail
+    sat_count = state.sat_count
+    props = 0  # flushed into stats once per call, not once per unit
+    while head < len(trail):
+        false_lit = -trail[head]
+        head += 1
+        watching = watches[false_lit]
+
+        i = 0
+        while i < len(watching):
+            ci = watching[i]
+            if sat_count[ci]:
+                i += 1
+                continue  # clause already satisfied: keep the watch, touch no literals
+
+            clause = clauses[ci]
+            if clause[0] == false_lit:
+                clause[0], clause[1] = clause[1], false_lit
+            other = clause[0]
+
+            # Look for a non-false literal to watch instead
+            for k in range(2, len(clause)):
+                lit = clause[k]
+                if value[lit] != -1:
+                    clause[1], clause[k] = lit, false_lit
+                    watches[lit].append(ci)
+                    watching[i] = watching[-1]
+                    watching.pop()
+                    break
+            else:
+                if value[other] == -1:
+                    stats["unit_props"] += props
+                    return clause  # conflict: every literal is false
+                props += 1
+                assign(state, other)
+                i += 1
+
+    stats["unit_props"] += props
+    return None
 
 # ------------------- PURE LITERAL ELIMINATION -------------------
-def pure_literal_elimination(clauses: List[List[int]], assignment: Dict[int, bool]) -> Tuple[List[List[int]], Dict[int, bool]]:
-    if not clauses:
-        return clauses, assignment
-        
-    all_literals = {lit for clause in clauses for lit in clause}
-    pure_literals = [lit for lit in all_literals if -lit not in all_literals]
-    
-    for lit in pure_literals:
+def pure_literal_elimination(state: SolverState) -> None:
+    """Assign every pure literal, following the cascade until no candidate is left.
+
+    Only literals whose open-clause count reached zero are candidates, so this costs
+    O(new zero counts) per node instead of a pass over all variables.
+    """
+    value, lit_count, candidates = state.value, state.lit_count, state.pure_candidates
+    pure = 0
+    while candidates:
+        lit = candidates.pop()
+        if not value[lit] and not lit_count[lit] and lit_count[-lit]:
+            pure += 1
+            assign(state, -lit)
+    stats["pure_literals"] += pure
+
+# ------------------- VSIDS BRANCHING -------------------
+VAR_DECAY = 0.95
+
+def bump_activity(state: SolverState, clause: List[int]) -> None:
+    """Bump the variables of a conflict clause and decay future bumps by growing var_inc."""
+    activity, order, in_order = state.activity, state.order, state.in_order
+    var_inc = state.var_inc
+    for lit in clause:
         var = abs(lit)
-        if var not in assignment:  # Only assign if not already assigned
-            stats["pure_literals"] += 1
-            assignment[var] = (lit > 0)
-            # Remove clauses containing this literal
-            clauses = [c for c in clauses if lit not in c]
-    
-    return clauses, assignment
+        activity[var] += var_inc
+        if in_order[var]:
+            heappush(order, (-activity[var], var))  # older entry goes stale
+
+    if max(activity[abs(lit)] for lit in clause) > 1e100:
+        # Scale everything down before the scores overflow and rebuild the heap
+        for var in range(len(activity)):
+            activity[var] *= 1e-100
+        var_inc *= 1e-100
+        order[:] = [(-activity[var], var) for var in range(1, len(activity)) if in_order[var]]
+        heapify(order)
+    state.var_inc = var_inc / VAR_DECAY
+
+def pick_branch_var(state: SolverState, parked: List[int]) -> int:
+    """Pop the most active open variable (lowest index on ties); 0 if all clauses are satisfied.
+
+    Stale heap entries and assigned variables are dropped lazily (backtrack re-inserts
+    variables it unassigns). Unassigned variables that occur in no open clause go to
+    `parked`, to be re-inserted when the current level is undone.
+    """
+    value, lit_count, activity = state.value, state.lit_count, state.activity
+    order, in_order = state.order, state.in_order
+    while order:
+        key, var = heappop(order)
+        if -key != activity[var]:
+            continue  # stale entry
+        in_order[var] = False
+        if value[var]:
+            continue
+        if lit_count[var] or lit_count[-var]:
+            return var
+        parked.append(var)
+    return 0
+
+def unpark(state: SolverState, parked: List[int]) -> None:
+    activity, order, in_order = state.activity, state.order, state.in_order
+    for var in parked:
+        if not in_order[var]:
+            in_order[var] = True
+            heappush(order, (-activity[var], var))
+    parked.clear()
 
 # ------------------- DPLL CORE -------------------
-def dpll(clauses: List[List[int]], assignment: Dict[int, bool]) -> Optional[Dict[int, bool]]:
-    stats["calls"] += 1
-    
-    # Unit propagation
-    clauses, assignment = unit_propagate(clauses, assignment)
-    if [] in clauses:
-        stats["backtracks"] += 1
-        return None
-    if not clauses:
-        return assignment
-    
-    # Pure literal elimination
-    clauses, assignment = pure_literal_elimination(clauses, assignment)
-    if [] in clauses:
+def search(state: SolverState) -> bool:
+    """Iterative DPLL over a single trail with chronological backtracking.
+
+    trail_lim[d] is the trail index of the decision opening level d + 1. Decisions
+    try the positive literal first, so a negative literal at trail[trail_lim[d]]
+    means both polarities of that level have been tried. parked[d] holds the
+    variables set aside by pick_branch_var at level d. Node and backtrack counts
+    are kept in locals and flushed into stats when the search returns.
+    """
+    trail = state.trail
+    trail_lim: List[int] = []
+    parked: List[List[int]] = [[]]
+    head = 0
+    calls = backtracks = 0
+    while True:
+        calls += 1
+
+        # Unit propagation
+        conflict = unit_propagate(state, head)
+        if conflict is None:
+            # Every clause satisfied: skip pure literals and the decision heap
+            if not state.open_count:
+                stats["calls"] += calls
+                stats["backtracks"] += backtracks
+                return True
+
+            # Pure literal elimination
+            head = len(trail)
+            pure_literal_elimination(state)
+            var = pick_branch_var(state, parked[-1])
+            if not var:
+                stats["calls"] += calls
+                stats["backtracks"] += backtracks
+                return True
+
+            trail_lim.append(len(trail))
+            parked.append([])
+            assign(state, var)
+            continue
+
+        # Conflict: unwind exhausted levels, then flip the latest untried decision
+        backtracks += 1
+        bump_activity(state, conflict)
+        while trail_lim and trail[trail_lim[-1]] < 0:
+            backtrack(state, trail_lim.pop())
+            unpark(state, parked.pop())
+            backtracks += 1
+        if not trail_lim:
+            stats["calls"] += calls
+            stats["backtracks"] += backtracks
+            return False
+
+        head = trail_lim[-1]
+        var = trail[head]
+        backtrack(state, head)
+        unpark(state, parked[-1])
+        assign(state, -var)
+
+def solve_formula(formula: Formula, assignment: Dict[int, bool]) -> Optional[Dict[int, bool]]:
+    """Run DPLL on a prepared Formula; repeated calls allocate only per-run state."""
+    state = SolverState(formula)
+    for var, val in assignment.items():
+        assign(state, var if val else -var)
+
+    # Empty clauses and contradicting unit clauses are caught once, up front;
+    # during search conflicts are reported by unit_propagate's return value.
+    conflict = formula.has_empty
+    for lit in formula.units:
+        if conflict or state.value[lit] == -1:
+            conflict = True
+            break
+        if state.value[lit] == 0:
+            stats["unit_props"] += 1
+            assign(state, lit)
+    if conflict:
+        stats["calls"] += 1
         stats["backtracks"] += 1
         return None
-    if not clauses:
-        return assignment
-    
-    # SIMPLE BASELINE variable selection - just pick first unassigned variable
-    all_vars = {abs(lit) for clause in clauses for lit in clause}
-    unassigned = [v for v in all_vars if v not in assignment]
-    if not unassigned:
-        return assignment
-    
-    # BASELINE: Simple first-unassigned variable selection (no heuristics)
-    var = min(unassigned)  # Pick smallest unassigned variable number
-    
-    # Try both assignments
-    for val in [True, False]:
-        new_assignment = assignment.copy()
-        new_assignment[var] = val
-        
-        # Apply assignment to clauses
-        new_clauses = []
-        conflict = False
-        
-        for clause in clauses:
-            pos_lit = var if val else -var
-            neg_lit = -var if val else var
-            
-            if pos_lit in clause:
-                continue  # clause satisfied
-            elif neg_lit in clause:
-                new_clause = [l for l in clause if l != neg_lit]
-                if not new_clause:  # empty clause
-                    conflict = True
-                    break
-                new_clauses.append(new_clause)
-            else:
-                new_clauses.append(clause[:])  # copy clause
-        
-        if not conflict:
-            result = dpll(new_clauses, new_assignment)
-            if result is not None:
-                return result
-    
-    stats["backtracks"] += 1
+
+    if search(state):
+        return {abs(lit): lit > 0 for lit in state.trail}
     return None
 
+def dpll(clauses: List[List[int]], assignment: Dict[int, bool]) -> Optional[Dict[int, bool]]:
+    return solve_formula(Formula(clauses, max(assignment, default=0)), assignment)
+
+def solve(clauses: List[List[int]], n_vars: int) -> Optional[Dict[int, bool]]:
+    """Entry point for the application scripts (package manager, hardware verifier).
+
+    Uses PySAT's MiniSat when python-sat is installed and this module's DPLL
+    otherwise. MiniSat assigns every variable 1..n_vars, DPLL only the ones it needed.
+    """
+    if Minisat22 is None:
+        return solve_formula(Formula(clauses, n_vars), {})
+    with Minisat22(bootstrap_with=clauses) as solver:
+        if not solver.solve():
+            return None
+        true_vars = {lit for lit in solver.get_model() if lit > 0}
+    return {var: var in true_vars for var in range(1, n_vars + 1)}
+
 # ------------------- SOLVER WRAPPER -------------------
 def solve_cnf(clauses: List[List[int]]):
     global stats
@@ -166,7 +382,7 @@ def solve_cnf(clauses: List[List[int]]):
         print("Result: SATISFIABLE")
         print("Assignment:", result)
     print("--------------------------------------")
-    print(f"Recursive Calls: {stats['calls']}")
+    print(f"Search Nodes: {stats['calls']}")
     print(f"Unit Propagations: {stats['unit_props']}")
     print(f"Pure Literals Used: {stats['pure_literals']}")
     print(f"Backtracks: {stats['backtracks']}")
@@ -6,24 +6,40 @@ import argparse
 # INTEGRATION: IMPORT YOUR TEAM'S DPLL SOLVER
 # ==============================================================================
 try:
-    from dpll_basic import dpll
+    from dpll_basic import solve
 except ImportError:
-    print("⚠️ Error: Could not import 'dpll' from 'dpll_basic.py'")
+    print("⚠️ Error: Could not import 'solve' from 'dpll_basic.py'")
     sys.exit(1)
 
-class SolverAdapter:
-    """Wrapper to make the function look like a class"""
-    def solve(self, clauses, n_vars):
-        return dpll(clauses, {})
-
 # ==============================================================================
 # HARDWARE VERIFICATION ENGINE
 # ==============================================================================
+# Up to this many primary inputs the Miter is checked by exhaustive simulation instead
+# of DPLL. Every wire holds a 2^n-bit truth column, so 16 inputs costs 8 KB per wire.
+SIMULATION_MAX_INPUTS = 16
+
+# Bit-parallel gate semantics: bit k of a column is the wire's value under input pattern k
+SIMULATION_OPS = {
+    "AND": lambda ins, mask: ins[0] & ins[1],
+    "OR": lambda ins, mask: ins[0] | ins[1],
+    "NOT": lambda ins, mask: mask ^ ins[0],
+    "NAND": lambda ins, mask: mask ^ (ins[0] & ins[1]),
+    "XOR": lambda ins, mask: ins[0] ^ ins[1],
+}
+
 class CircuitVerifier:
     def __init__(self):
         self.clauses = []
         self.var_count = 0
         self.gate_map = {} # Maps string names (e.g. "wire_1") to integer IDs
+        # Gate type -> (Tseitin emitter, number of inputs); replaces an if/elif chain per gate
+        self.emitters = {
+            "AND": (self._add_and, 2),
+            "OR": (self._add_or, 2),
+            "NOT": (self._add_not, 1),
+            "NAND": (self._add_nand, 2),
+            "XOR": (self._add_xor, 2),
+        }
 
     def get_var_id(self, name):
         """Returns the SAT ID for a wire name, creating it if new."""
@@ -35,46 +51,32 @@ class CircuitVerifier:
     # --- TSEITIN TRANSFORMATIONS ---
     def add_gate(self, gate_type, inputs, output):
         """Dispatch method to add gates based on string type."""
-        out = self.get_var_id(output)
-        ins = [self.get_var_id(n) for n in inputs]
-
-        if gate_type == "AND":
-            self._add_and(ins[0], ins[1], out)
-        elif gate_type == "OR":
-            self._add_or(ins[0], ins[1], out)
-        elif gate_type == "NOT":
-            self._add_not(ins[0], out)
-        elif gate_type == "NAND":
-            self._add_nand(ins[0], ins[1], out)
-        elif gate_type == "XOR":
-            self._add_xor(ins[0], ins[1], out)
-        else:
+        get_id = self.get_var_id
+        out = get_id(output)
+        ins = [get_id(n) for n in inputs]
+
+        emitter = self.emitters.get(gate_type)
+        if emitter is None:
             print(f"⚠️ Warning: Unknown gate type '{gate_type}'")
+            return
+        emit, arity = emitter
+        emit(*ins[:arity], out)
 
+    # Each emitter writes all of a gate's clauses with a single extend
     def _add_and(self, a, b, out):
-        self.clauses.append([-a, -b, out])
-        self.clauses.append([a, -out])
-        self.clauses.append([b, -out])
+        self.clauses.extend(([-a, -b, out], [a, -out], [b, -out]))
 
     def _add_or(self, a, b, out):
-        self.clauses.append([a, b, -out])
-        self.clauses.append([-a, out])
-        self.clauses.append([-b, out])
+        self.clauses.extend(([a, b, -out], [-a, out], [-b, out]))
 
     def _add_not(self, a, out):
-        self.clauses.append([-a, -out])
-        self.clauses.append([a, out])
+        self.clauses.extend(([-a, -out], [a, out]))
 
     def _add_nand(self, a, b, out):
-        self.clauses.append([-a, -b, -out])
-        self.clauses.append([a, out])
-        self.clauses.append([b, out])
+        self.clauses.extend(([-a, -b, -out], [a, out], [b, out]))
 
     def _add_xor(self, a, b, out):
-        self.clauses.append([-a, -b, -out])
-        self.clauses.append([a, b, -out])
-        self.clauses.append([a, -b, out])
-        self.clauses.append([-a, b, out])
+        self.clauses.extend(([-a, -b, -out], [a, b, -out], [a, -b, out], [-a, b, out]))
 
     def verify_json_scenario(self, json_file, scenario_name):
         """Parses JSON and builds the Miter circuit."""
@@ -90,9 +92,22 @@ class CircuitVerifier:
             print(f"\n--- Scenario: {scenario_name} ---")
             print(f"Description: {scenario.get('description', '')}")
 
+            # 0. Few primary inputs: simulate every input pattern at once, no SAT needed
+            if len(scenario['inputs']) <= SIMULATION_MAX_INPUTS:
+                try:
+                    counter_example = self.simulate_miter(scenario)
+                except ValueError:
+                    pass  # not a plain feed-forward netlist: fall back to DPLL
+                else:
+                    print(f"Verifying by exhaustive simulation... "
+                          f"({1 << len(scenario['inputs'])} input patterns, {len(scenario['gates'])} gates)")
+                    self.report(counter_example)
+                    return
+
             # 1. Build the internal circuits
+            add_gate = self.add_gate
             for g in scenario['gates']:
-                self.add_gate(g['type'], g['in'], g['out'])
+                add_gate(g['type'], g['in'], g['out'])
 
             # 2. Build the Miter (XOR the two comparison outputs)
             compare_nodes = scenario['compare']
@@ -111,25 +126,77 @@ class CircuitVerifier:
         except FileNotFoundError:
             print("Error: JSON file not found.")
 
+    def simulate_miter(self, scenario):
+        """Evaluates both circuits on all 2^n input patterns with bitwise ops on truth columns.
+
+        Returns a counter-example {input: 0/1}, or None if the outputs never differ.
+        Raises ValueError for netlists that cannot be simulated (unknown gate types,
+        undriven wires or combinational loops).
+        """
+        input_names = scenario['inputs']
+        patterns = 1 << len(input_names)
+        mask = (1 << patterns) - 1
+
+        columns = {}
+        for i, name in enumerate(input_names):
+            # Input i is 0 for 2^i patterns, then 1 for 2^i patterns, repeated
+            width = 1 << i
+            column = ((1 << width) - 1) << width
+            span = 2 * width
+            while span < patterns:
+                column |= column << span
+                span *= 2
+            columns[name] = column & mask
+
+        pending = scenario['gates']
+        while pending:
+            blocked = []
+            for g in pending:
+                if g['type'] not in SIMULATION_OPS:
+                    raise ValueError(f"Unknown gate type '{g['type']}'")
+                if all(n in columns for n in g['in']):
+                    ins = [columns[n] for n in g['in']]
+                    columns[g['out']] = SIMULATION_OPS[g['type']](ins, mask)
+                else:
+                    blocked.append(g)
+            if len(blocked) == len(pending):
+                raise ValueError("Undriven wire or combinational loop")
+            pending = blocked
+
+        ref_name, opt_name = scenario['compare']
+        if ref_name not in columns or opt_name not in columns:
+            raise ValueError("Compared wire is never driven")
+        diff = columns[ref_name] ^ columns[opt_name]
+        if not diff:
+            return None
+        pattern = (diff & -diff).bit_length() - 1  # first differing input pattern
+        return {name: (pattern >> i) & 1 for i, name in enumerate(input_names)}
+
     def run_verification(self, input_names):
         print(f"Verifying... ({self.var_count} wires, {len(self.clauses)} clauses)")
-        solver = SolverAdapter()
-        result = solver.solve(self.clauses, self.var_count)
+        result = solve(self.clauses, self.var_count)
         
         if result is None:
-            print("\n✅ RESULT: UNSAT (Equivalent)")
-            print("   Success: No input combination makes the outputs differ.")
+            self.report(None)
         else:
-            print("\n❌ RESULT: SAT (Not Equivalent)")
-            print("   Bug Found! Counter-example inputs:")
-            inputs_found = []
+            counter_example = {}
             for name in input_names:
                 vid = self.gate_map.get(name)
                 val = result.get(vid, False)
                 # If result returns DIMACS list instead of dict
                 if isinstance(result, list):
                     val = vid in result
-                inputs_found.append(f"{name}={int(val)}")
+                counter_example[name] = int(val)
+            self.report(counter_example)
+
+    def report(self, counter_example):
+        if counter_example is None:
+            print("\n✅ RESULT: UNSAT (Equivalent)")
+            print("   Success: No input combination makes the outputs differ.")
+        else:
+            print("\n❌ RESULT: SAT (Not Equivalent)")
+            print("   Bug Found! Counter-example inputs:")
+            inputs_found = [f"{name}={val}" for name, val in counter_example.items()]
             print(f"   {', '.join(inputs_found)}")
 
 # ==============================================================================
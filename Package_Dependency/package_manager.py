@@ -6,23 +6,13 @@ import argparse
 # INTEGRATION SECTION: CONNECTING TO YOUR dpll_basic.py
 # ==============================================================================
 try:
-    # We import the specific function 'dpll' from your file 'dpll_basic'
-    from dpll_basic import dpll
+    # solve(clauses, n_vars) runs the DPLL solver from an empty assignment
+    from dpll_basic import solve
 except ImportError:
     print("\n⚠️  IMPORT ERROR: Could not find 'dpll_basic.py'.")
     print("    Make sure the file is named exactly 'dpll_basic.py'")
     sys.exit(1)
 
-# We create a wrapper class so the Package Manager treats it like an object
-class SolverAdapter:
-    def solve(self, clauses, n_vars):
-        """
-        Adapts the package manager's call style to your dpll function.
-        """
-        # Your dpll function takes (clauses, assignment_dict)
-        # We pass an empty dict {} as the starting assignment
-        return dpll(clauses, {})
-
 # ==============================================================================
 # PACKAGE MANAGER LOGIC
 # ==============================================================================
@@ -112,8 +102,7 @@ class PackageProblemEncoder:
         n_vars = self.counter - 1
         
         # --- CALL DPLL SOLVER ---
-        solver = SolverAdapter()
-        result = solver.solve(current_clauses, n_vars)
+        result = solve(current_clauses, n_vars)
         
         if result is not None:
             print("✅ Plan Approved. Packages to install:")
@@ -5,7 +5,11 @@ Prioritizes time comparison with optimized bar chart visibility for both solvers
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # figures are only saved to PNG, no GUI backend needed
 import matplotlib.pyplot as plt
+from matplotlib.collections import PatchCollection
+from matplotlib.patches import Rectangle
 import numpy as np
 import seaborn as sns
 from pathlib import Path
@@ -15,24 +19,126 @@ plt.style.use('seaborn-v0_8-whitegrid')
 sns.set_context("notebook", font_scale=1.1)
 SET_COLOR = '#FF6B6B'  # Coral red for Set-Based
 CDCL_COLOR = '#4ECDC4'  # Turquoise for CDCL
+DPI = 150  # report resolution for saved figures
+PNG_COMPRESS_LEVEL = 1  # zlib level for PNG output: much faster than the default 6, slightly larger files
+
+# Bar gradients, sampled once: 30-bar panels of the comprehensive figure
+# and 40-bar panels of the focused figure
+REDS_30 = plt.cm.Reds(np.linspace(0.5, 0.9, 30))
+GNBU_30 = plt.cm.GnBu(np.linspace(0.5, 0.9, 30))
+REDS_40 = plt.cm.Reds(np.linspace(0.4, 0.95, 40))
+GNBU_40 = plt.cm.GnBu(np.linspace(0.4, 0.95, 40))
+ORANGES_40 = plt.cm.Oranges(np.linspace(0.4, 0.95, 40))
+PURPLES_40 = plt.cm.Purples(np.linspace(0.4, 0.95, 40))
+
+# Bar panel styles for the packed 3x3 figure and the roomier 2x2 figure
+COMPACT_BARS = dict(edge_width=0.8, label_size=12, title_size=13, grid=dict(alpha=0.3))
+FOCUSED_BARS = dict(edge_width=0.7, label_size=13, title_size=14, title_pad=10,
+                    grid=dict(alpha=0.35, linewidth=0.8))
+
+def summarize(values):
+    """Summary statistics of one column (std is the sample std, as in pandas)"""
+    return {
+        'mean': values.mean(),
+        'median': np.median(values),
+        'min': values.min(),
+        'max': values.max(),
+        'std': values.std(ddof=1),
+    }
 
 def load_data(csv_path):
-    """Load benchmark results from CSV"""
-    df = pd.read_csv(csv_path)
+    """Load benchmark results from CSV as NumPy arrays plus their summary statistics"""
+    columns = ['set_time', 'cdcl_time', 'speedup_ratio']
+    df = pd.read_csv(csv_path, usecols=columns, dtype=dict.fromkeys(columns, 'float64'),
+                     engine='c')
+    arrays = {
+        'set': df['set_time'].to_numpy(),
+        'cdcl': df['cdcl_time'].to_numpy(),
+        'speedup': df['speedup_ratio'].to_numpy(),
+    }
+    stats = {name: summarize(values) for name, values in arrays.items()}
     print(f"✓ Loaded {len(df)} instances")
-    return df
+    return arrays, stats
+
+def format_stats_text(stats, num_instances):
+    """Text of the statistics panel, formatted once from the precomputed stats"""
+    return f"""╔══════════════════════════════════════╗
+║      PERFORMANCE STATISTICS          ║
+╚══════════════════════════════════════╝
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SET-BASED SOLVER
+  Mean Time:     {stats['set']['mean']:>8.4f} s
+  Median Time:   {stats['set']['median']:>8.4f} s
+  Min Time:      {stats['set']['min']:>8.4f} s
+  Max Time:      {stats['set']['max']:>8.4f} s
+  Std Dev:       {stats['set']['std']:>8.4f} s
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+CDCL SOLVER
+  Mean Time:     {stats['cdcl']['mean']:>8.6f} s
+  Median Time:   {stats['cdcl']['median']:>8.6f} s
+  Min Time:      {stats['cdcl']['min']:>8.6f} s
+  Max Time:      {stats['cdcl']['max']:>8.6f} s
+  Std Dev:       {stats['cdcl']['std']:>8.6f} s
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+SPEEDUP METRICS
+  Average:       {stats['speedup']['mean']:>8.2f}x
+  Median:        {stats['speedup']['median']:>8.2f}x
+  Maximum:       {stats['speedup']['max']:>8.2f}x
+  Minimum:       {stats['speedup']['min']:>8.2f}x
+
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+INSTANCES ANALYZED: {num_instances}
+    """
+
+def _styled_bar(ax, values, colors, title, edge_width, label_size, title_size, grid,
+                title_pad=None, first_index=0, zoom=None, mean_color=None, mean_fmt='.3f'):
+    """Gradient bar chart of per-instance times, optionally zoomed and with a mean line"""
+    x = np.arange(len(values))
+    # One collection with per-bar face colors instead of one Rectangle artist per bar
+    bars = PatchCollection([Rectangle((i - 0.4, 0), 0.8, v) for i, v in zip(x, values)],
+                           facecolors=colors, edgecolor='black', linewidth=edge_width,
+                           alpha=0.85, rasterized=True)
+    bars.sticky_edges.y.append(0)  # bars start at the axis, as with ax.bar
+    ax.add_collection(bars)
+    ax.autoscale_view()
+    ax.set_xlabel('Instance Index', fontsize=label_size, fontweight='bold')
+    ax.set_ylabel('Time (seconds)', fontsize=label_size, fontweight='bold')
+    ax.set_title(title, fontsize=title_size, fontweight='bold', pad=title_pad)
+    ax.grid(True, axis='y', linestyle='--', **grid)
+    ax.set_xticks(x[::5])
+    ax.set_xticklabels(first_index + x[::5])
+    
+    # Zoom the y-axis onto the data range (relative margin `zoom`)
+    if zoom is not None:
+        low, high = values.min(), values.max()
+        margin = (high - low) * zoom
+        ax.set_ylim(max(0, low - margin), high + margin)
+    
+    if mean_color is not None:
+        mean = values.mean()
+        ax.axhline(mean, color=mean_color, linestyle='--', linewidth=2, 
+                   label=f'Mean: {mean:{mean_fmt}}s', alpha=0.7)
+        ax.legend(fontsize=11)
 
-def plot_enhanced_time_comparison(df, output_dir):
+def plot_enhanced_time_comparison(arrays, stats, stats_text, output_dir):
     """Create enhanced time comparison with separate scales for bar visibility"""
-    fig = plt.figure(figsize=(20, 14))
-    gs = fig.add_gridspec(3, 3, hspace=0.35, wspace=0.35)
+    fig = plt.figure(figsize=(20, 14), layout='constrained')
+    fig.get_layout_engine().set(hspace=0.05, wspace=0.05)
+    gs = fig.add_gridspec(3, 3)
     
     # ============= MAIN PLOT: Dual Y-Axis Line Plot =============
     ax_main = fig.add_subplot(gs[0, :])
-    x = np.arange(len(df))
+    x = np.arange(len(arrays['set']))
     
     # Primary y-axis for Set-Based
-    ax_main.plot(x, df['set_time'], label='Set-Based Solver', color=SET_COLOR, 
+    ax_main.plot(x, arrays['set'], label='Set-Based Solver', color=SET_COLOR, 
                  linewidth=2.5, alpha=0.85, marker='o', markersize=4, markevery=5)
     ax_main.set_xlabel('Instance Index', fontsize=14, fontweight='bold')
     ax_main.set_ylabel('Set-Based Time (seconds)', fontsize=14, fontweight='bold', color=SET_COLOR)
@@ -44,7 +150,7 @@ def plot_enhanced_time_comparison(df, output_dir):
     
     # Secondary y-axis for CDCL
     ax_main_twin = ax_main.twinx()
-    ax_main_twin.plot(x, df['cdcl_time'], label='CDCL Solver', color=CDCL_COLOR, 
+    ax_main_twin.plot(x, arrays['cdcl'], label='CDCL Solver', color=CDCL_COLOR, 
                       linewidth=2.5, alpha=0.85, marker='s', markersize=4, markevery=5)
     ax_main_twin.set_ylabel('CDCL Time (seconds)', fontsize=14, fontweight='bold', color=CDCL_COLOR)
     ax_main_twin.tick_params(axis='y', labelcolor=CDCL_COLOR, labelsize=12)
@@ -60,39 +166,12 @@ def plot_enhanced_time_comparison(df, output_dir):
     ax_main.legend(lines1 + lines2, labels1 + labels2, fontsize=13, 
                   loc='upper left', framealpha=0.95, edgecolor='black')
     
-    # ============= BAR CHART 1: Set-Based (First 30) =============
-    ax1 = fig.add_subplot(gs[1, 0])
-    n = 30
-    x_bar = np.arange(n)
-    colors_gradient = plt.cm.Reds(np.linspace(0.5, 0.9, n))
-    
-    bars1 = ax1.bar(x_bar, df['set_time'][:n], color=colors_gradient, 
-                    edgecolor='black', linewidth=0.8, alpha=0.85)
-    ax1.set_xlabel('Instance Index', fontsize=12, fontweight='bold')
-    ax1.set_ylabel('Time (seconds)', fontsize=12, fontweight='bold')
-    ax1.set_title('Set-Based Solver - First 30 Instances', fontsize=13, fontweight='bold')
-    ax1.grid(True, alpha=0.3, axis='y', linestyle='--')
-    ax1.set_xticks(x_bar[::5])
-    ax1.set_xticklabels(x_bar[::5])
-    
-    # ============= BAR CHART 2: CDCL (First 30) - OPTIMIZED SCALE =============
-    ax2 = fig.add_subplot(gs[1, 1])
-    colors_gradient2 = plt.cm.GnBu(np.linspace(0.5, 0.9, n))
-    
-    bars2 = ax2.bar(x_bar, df['cdcl_time'][:n], color=colors_gradient2, 
-                    edgecolor='black', linewidth=0.8, alpha=0.85)
-    ax2.set_xlabel('Instance Index', fontsize=12, fontweight='bold')
-    ax2.set_ylabel('Time (seconds)', fontsize=12, fontweight='bold')
-    ax2.set_title('CDCL Solver - First 30 Instances', fontsize=13, fontweight='bold')
-    ax2.grid(True, alpha=0.3, axis='y', linestyle='--')
-    ax2.set_xticks(x_bar[::5])
-    ax2.set_xticklabels(x_bar[::5])
-    
-    # OPTIMIZE Y-AXIS for CDCL visibility
-    cdcl_max = df['cdcl_time'][:n].max()
-    cdcl_min = df['cdcl_time'][:n].min()
-    y_margin = (cdcl_max - cdcl_min) * 0.15
-    ax2.set_ylim(max(0, cdcl_min - y_margin), cdcl_max + y_margin)
+    # ============= BAR CHARTS: Set-Based and CDCL (First 30) =============
+    _styled_bar(fig.add_subplot(gs[1, 0]), arrays['set'][:30], REDS_30,
+                'Set-Based Solver - First 30 Instances', **COMPACT_BARS)
+    # CDCL y-axis zoomed for visibility
+    _styled_bar(fig.add_subplot(gs[1, 1]), arrays['cdcl'][:30], GNBU_30,
+                'CDCL Solver - First 30 Instances', zoom=0.15, **COMPACT_BARS)
     
     # ============= SIDE-BY-SIDE BAR COMPARISON (First 20) =============
     ax3 = fig.add_subplot(gs[1, 2])
@@ -100,10 +179,10 @@ def plot_enhanced_time_comparison(df, output_dir):
     x_comp = np.arange(n2)
     width = 0.38
     
-    bars_set = ax3.bar(x_comp - width/2, df['set_time'][:n2], width, 
+    bars_set = ax3.bar(x_comp - width/2, arrays['set'][:n2], width, 
                        label='Set-Based', color=SET_COLOR, alpha=0.8, 
                        edgecolor='black', linewidth=0.8)
-    bars_cdcl = ax3.bar(x_comp + width/2, df['cdcl_time'][:n2], width, 
+    bars_cdcl = ax3.bar(x_comp + width/2, arrays['cdcl'][:n2], width, 
                         label='CDCL', color=CDCL_COLOR, alpha=0.8, 
                         edgecolor='black', linewidth=0.8)
     
@@ -117,9 +196,9 @@ def plot_enhanced_time_comparison(df, output_dir):
     
     # ============= LOG-SCALE SCATTER PLOT =============
     ax4 = fig.add_subplot(gs[2, 0])
-    scatter = ax4.scatter(df['set_time'], df['cdcl_time'], alpha=0.7, s=80, 
-                         c=df['speedup_ratio'], cmap='viridis', 
-                         edgecolors='black', linewidth=0.8)
+    scatter = ax4.scatter(arrays['set'], arrays['cdcl'], alpha=0.7, s=80, 
+                         c=arrays['speedup'], cmap='viridis', 
+                         edgecolors='black', linewidth=0.8, rasterized=True)
     ax4.set_xscale('log')
     ax4.set_yscale('log')
     ax4.set_xlabel('Set-Based Time (log scale)', fontsize=12, fontweight='bold')
@@ -127,8 +206,8 @@ def plot_enhanced_time_comparison(df, output_dir):
     ax4.set_title('Time Correlation (Log-Log Scale)', fontsize=13, fontweight='bold')
     
     # Diagonal line
-    min_t = min(df['set_time'].min(), df['cdcl_time'].min())
-    max_t = max(df['set_time'].max(), df['cdcl_time'].max())
+    min_t = min(stats['set']['min'], stats['cdcl']['min'])
+    max_t = max(stats['set']['max'], stats['cdcl']['max'])
     ax4.plot([min_t, max_t], [min_t, max_t], 'r--', alpha=0.6, linewidth=2, 
              label='Equal Time Line')
     
@@ -141,9 +220,9 @@ def plot_enhanced_time_comparison(df, output_dir):
     ax5 = fig.add_subplot(gs[2, 1])
     
     # Create violin plots
-    parts = ax5.violinplot([df['set_time'], df['cdcl_time']], 
+    parts = ax5.violinplot([arrays['set'], arrays['cdcl']], 
                            positions=[1, 2], widths=0.6,
-                           showmeans=True, showmedians=True)
+                           showmeans=True, showmedians=True, points=50)
     
     # Color the violins
     colors_violin = [SET_COLOR, CDCL_COLOR]
@@ -169,41 +248,6 @@ def plot_enhanced_time_comparison(df, output_dir):
     ax6 = fig.add_subplot(gs[2, 2])
     ax6.axis('off')
     
-    stats_text = f"""╔══════════════════════════════════════╗
-║      PERFORMANCE STATISTICS          ║
-╚══════════════════════════════════════╝
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-SET-BASED SOLVER
-  Mean Time:     {df['set_time'].mean():>8.4f} s
-  Median Time:   {df['set_time'].median():>8.4f} s
-  Min Time:      {df['set_time'].min():>8.4f} s
-  Max Time:      {df['set_time'].max():>8.4f} s
-  Std Dev:       {df['set_time'].std():>8.4f} s
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-CDCL SOLVER
-  Mean Time:     {df['cdcl_time'].mean():>8.6f} s
-  Median Time:   {df['cdcl_time'].median():>8.6f} s
-  Min Time:      {df['cdcl_time'].min():>8.6f} s
-  Max Time:      {df['cdcl_time'].max():>8.6f} s
-  Std Dev:       {df['cdcl_time'].std():>8.6f} s
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-SPEEDUP METRICS
-  Average:       {df['speedup_ratio'].mean():>8.2f}x
-  Median:        {df['speedup_ratio'].median():>8.2f}x
-  Maximum:       {df['speedup_ratio'].max():>8.2f}x
-  Minimum:       {df['speedup_ratio'].min():>8.2f}x
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-INSTANCES ANALYZED: {len(df)}
-    """
-    
     ax6.text(0.1, 0.5, stats_text, fontsize=10, ha='left', va='center',
             family='monospace', 
             bbox=dict(boxstyle='round', facecolor='#F5F5DC', alpha=0.9, 
@@ -211,116 +255,46 @@ INSTANCES ANALYZED: {len(df)}
     
     # Overall title
     fig.suptitle('🎯 Comprehensive Solving Time Analysis: Set-Based vs CDCL 🎯', 
-                fontsize=18, fontweight='bold', y=0.995)
+                fontsize=18, fontweight='bold')
     
-    plt.tight_layout()
     output_path = output_dir / 'enhanced_solving_time_comparison.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(output_path, dpi=DPI, bbox_inches='tight', facecolor='white',
+                pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
     print(f"✓ Saved: {output_path.name}")
     plt.close()
 
-def plot_focused_bar_charts(df, output_dir):
+def plot_focused_bar_charts(arrays, output_dir):
     """Create focused bar charts with optimized scales"""
-    fig, axes = plt.subplots(2, 2, figsize=(18, 12))
+    fig, axes = plt.subplots(2, 2, figsize=(18, 12), layout='constrained')
     fig.patch.set_facecolor('white')
     
-    # ============= SET-BASED: First 40 instances =============
-    ax1 = axes[0, 0]
     n = 40
-    x = np.arange(n)
-    colors1 = plt.cm.Reds(np.linspace(0.4, 0.95, n))
-    
-    bars1 = ax1.bar(x, df['set_time'][:n], color=colors1, 
-                    edgecolor='black', linewidth=0.7, alpha=0.85)
-    ax1.set_xlabel('Instance Index', fontsize=13, fontweight='bold')
-    ax1.set_ylabel('Time (seconds)', fontsize=13, fontweight='bold')
-    ax1.set_title('Set-Based Solver - First 40 Instances', fontsize=14, fontweight='bold', pad=10)
-    ax1.grid(True, alpha=0.35, axis='y', linestyle='--', linewidth=0.8)
-    ax1.set_xticks(x[::5])
-    
-    # Add mean line
-    mean_set = df['set_time'][:n].mean()
-    ax1.axhline(mean_set, color='darkred', linestyle='--', linewidth=2, 
-                label=f'Mean: {mean_set:.3f}s', alpha=0.7)
-    ax1.legend(fontsize=11)
-    
-    # ============= CDCL: First 40 instances - OPTIMIZED Y-AXIS =============
-    ax2 = axes[0, 1]
-    colors2 = plt.cm.GnBu(np.linspace(0.4, 0.95, n))
-    
-    bars2 = ax2.bar(x, df['cdcl_time'][:n], color=colors2, 
-                    edgecolor='black', linewidth=0.7, alpha=0.85)
-    ax2.set_xlabel('Instance Index', fontsize=13, fontweight='bold')
-    ax2.set_ylabel('Time (seconds)', fontsize=13, fontweight='bold')
-    ax2.set_title('CDCL Solver - First 40 Instances (Optimized Scale)', 
-                 fontsize=14, fontweight='bold', pad=10)
-    ax2.grid(True, alpha=0.35, axis='y', linestyle='--', linewidth=0.8)
-    ax2.set_xticks(x[::5])
-    
-    # OPTIMIZE Y-AXIS for better visibility
-    cdcl_max = df['cdcl_time'][:n].max()
-    cdcl_min = df['cdcl_time'][:n].min()
-    y_range = cdcl_max - cdcl_min
-    ax2.set_ylim(max(0, cdcl_min - y_range*0.1), cdcl_max + y_range*0.1)
-    
-    # Add mean line
-    mean_cdcl = df['cdcl_time'][:n].mean()
-    ax2.axhline(mean_cdcl, color='darkblue', linestyle='--', linewidth=2, 
-                label=f'Mean: {mean_cdcl:.4f}s', alpha=0.7)
-    ax2.legend(fontsize=11)
-    
-    # ============= SET-BASED: Last 40 instances =============
-    ax3 = axes[1, 0]
-    x2 = np.arange(n)
-    start_idx = len(df) - n
-    colors3 = plt.cm.Oranges(np.linspace(0.4, 0.95, n))
-    
-    bars3 = ax3.bar(x2, df['set_time'][start_idx:].values, color=colors3, 
-                    edgecolor='black', linewidth=0.7, alpha=0.85)
-    ax3.set_xlabel('Instance Index', fontsize=13, fontweight='bold')
-    ax3.set_ylabel('Time (seconds)', fontsize=13, fontweight='bold')
-    ax3.set_title(f'Set-Based Solver - Last 40 Instances ({start_idx}-{len(df)-1})', 
-                 fontsize=14, fontweight='bold', pad=10)
-    ax3.grid(True, alpha=0.35, axis='y', linestyle='--', linewidth=0.8)
-    ax3.set_xticks(x2[::5])
-    ax3.set_xticklabels([start_idx + i for i in x2[::5]])
-    
-    mean_set2 = df['set_time'][start_idx:].mean()
-    ax3.axhline(mean_set2, color='darkorange', linestyle='--', linewidth=2, 
-                label=f'Mean: {mean_set2:.3f}s', alpha=0.7)
-    ax3.legend(fontsize=11)
-    
-    # ============= CDCL: Last 40 instances - OPTIMIZED Y-AXIS =============
-    ax4 = axes[1, 1]
-    colors4 = plt.cm.Purples(np.linspace(0.4, 0.95, n))
-    
-    bars4 = ax4.bar(x2, df['cdcl_time'][start_idx:].values, color=colors4, 
-                    edgecolor='black', linewidth=0.7, alpha=0.85)
-    ax4.set_xlabel('Instance Index', fontsize=13, fontweight='bold')
-    ax4.set_ylabel('Time (seconds)', fontsize=13, fontweight='bold')
-    ax4.set_title(f'CDCL Solver - Last 40 Instances (Optimized Scale)', 
-                 fontsize=14, fontweight='bold', pad=10)
-    ax4.grid(True, alpha=0.35, axis='y', linestyle='--', linewidth=0.8)
-    ax4.set_xticks(x2[::5])
-    ax4.set_xticklabels([start_idx + i for i in x2[::5]])
-    
-    # OPTIMIZE Y-AXIS
-    cdcl_max2 = df['cdcl_time'][start_idx:].max()
-    cdcl_min2 = df['cdcl_time'][start_idx:].min()
-    y_range2 = cdcl_max2 - cdcl_min2
-    ax4.set_ylim(max(0, cdcl_min2 - y_range2*0.1), cdcl_max2 + y_range2*0.1)
-    
-    mean_cdcl2 = df['cdcl_time'][start_idx:].mean()
-    ax4.axhline(mean_cdcl2, color='purple', linestyle='--', linewidth=2, 
-                label=f'Mean: {mean_cdcl2:.4f}s', alpha=0.7)
-    ax4.legend(fontsize=11)
+    num_instances = len(arrays['set'])
+    start_idx = num_instances - n
+    
+    # ============= First 40 instances (CDCL y-axis zoomed) =============
+    _styled_bar(axes[0, 0], arrays['set'][:n], REDS_40,
+                'Set-Based Solver - First 40 Instances',
+                mean_color='darkred', **FOCUSED_BARS)
+    _styled_bar(axes[0, 1], arrays['cdcl'][:n], GNBU_40,
+                'CDCL Solver - First 40 Instances (Optimized Scale)',
+                zoom=0.1, mean_color='darkblue', mean_fmt='.4f', **FOCUSED_BARS)
+    
+    # ============= Last 40 instances (CDCL y-axis zoomed) =============
+    _styled_bar(axes[1, 0], arrays['set'][start_idx:], ORANGES_40,
+                f'Set-Based Solver - Last 40 Instances ({start_idx}-{num_instances-1})',
+                first_index=start_idx, mean_color='darkorange', **FOCUSED_BARS)
+    _styled_bar(axes[1, 1], arrays['cdcl'][start_idx:], PURPLES_40,
+                'CDCL Solver - Last 40 Instances (Optimized Scale)',
+                first_index=start_idx, zoom=0.1, mean_color='purple', mean_fmt='.4f',
+                **FOCUSED_BARS)
     
     plt.suptitle('Detailed Bar Chart Analysis - Optimized for Visibility', 
-                fontsize=16, fontweight='bold', y=0.995)
-    plt.tight_layout()
+                fontsize=16, fontweight='bold')
     
     output_path = output_dir / 'focused_bar_charts.png'
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
+    plt.savefig(output_path, dpi=DPI, bbox_inches='tight', facecolor='white',
+                pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
     print(f"✓ Saved: {output_path.name}")
     plt.close()
 
@@ -335,13 +309,14 @@ def main():
     print("="*70)
     print()
     
-    df = load_data(csv_path)
+    arrays, stats = load_data(csv_path)
+    stats_text = format_stats_text(stats, len(arrays['set']))
     
     print("\n[1/2] Generating comprehensive time comparison...")
-    plot_enhanced_time_comparison(df, output_dir)
+    plot_enhanced_time_comparison(arrays, stats, stats_text, output_dir)
     
     print("[2/2] Generating focused bar charts with optimized scales...")
-    plot_focused_bar_charts(df, output_dir)
+    plot_focused_bar_charts(arrays, output_dir)
     
     print("\n" + "="*70)
     print("✅ ALL ENHANCED PLOTS GENERATED")
@@ -349,9 +324,9 @@ def main():
     print("="*70)
     
     print("\n📊 Quick Stats:")
-    print(f"  Set-Based: {df['set_time'].mean():.4f}s avg, {df['set_time'].max():.4f}s max")
-    print(f"  CDCL:      {df['cdcl_time'].mean():.6f}s avg, {df['cdcl_time'].max():.6f}s max")
-    print(f"  Speedup:   {df['speedup_ratio'].mean():.2f}x average")
+    print(f"  Set-Based: {stats['set']['mean']:.4f}s avg, {stats['set']['max']:.4f}s max")
+    print(f"  CDCL:      {stats['cdcl']['mean']:.6f}s avg, {stats['cdcl']['max']:.6f}s max")
+    print(f"  Speedup:   {stats['speedup']['mean']:.2f}x average")
 
 if __name__ == '__main__':
     main()
@@ -7,7 +7,27 @@ Backtracking Sudoku Solver using
 """
 
 import time
-import copy
+
+
+# The solver works on a flat board of 81 cells (cell = row * 9 + col) and
+# 81 domain bitmasks (bit v set = value v still possible). Assigned cells
+# have an empty mask, so the hot loops only need to read the domains.
+# DOMAIN_SIZE[mask] is the number of values left in mask.
+DOMAIN_SIZE = [bin(mask).count("1") for mask in range(1 << 10)]
+ALL_VALUES = 0b1111111110  # values 1..9
+
+
+def _peers(cell):
+    row, col = divmod(cell, 9)
+    start = 27 * (row // 3) + 3 * (col // 3)
+    same_row = set(range(row * 9, row * 9 + 9))
+    same_col = set(range(col, 81, 9))
+    same_block = {r + c for r in range(start, start + 27, 9) for c in range(3)}
+    return tuple(sorted((same_row | same_col | same_block) - {cell}))
+
+
+# PEERS[cell]: the 20 other cells sharing a row, column or block with cell
+PEERS = [_peers(cell) for cell in range(81)]
 
 
 # ---------------------- Utility functions ----------------------
@@ -25,111 +45,128 @@ def print_board(board):
     print()
 
 
-def find_unassigned_mrv(board, domains):
+def find_unassigned_mrv(domains):
     """
     Select unassigned cell using MRV heuristic:
     the one with the fewest remaining possible values.
     """
     min_len = 10
     best_cell = None
-    for i in range(9):
-        for j in range(9):
-            if board[i][j] == 0:
-                domain_size = len(domains[(i, j)])
-                if domain_size < min_len:
-                    min_len = domain_size
-                    best_cell = (i, j)
+    for i in range(81):
+        mask = domains[i]
+        if mask:
+            domain_size = DOMAIN_SIZE[mask]
+            if domain_size < min_len:
+                if domain_size == 1:
+                    return i  # no unassigned cell can do better
+                min_len = domain_size
+                best_cell = i
     return best_cell
 
 
-def is_valid(board, row, col, val):
-    """Check Sudoku constraints for placing val at (row, col)."""
-    # Row
-    if val in board[row]:
-        return False
-    # Column
-    for i in range(9):
-        if board[i][col] == val:
-            return False
-    # 3x3 block
-    start_r, start_c = 3 * (row // 3), 3 * (col // 3)
-    for r in range(start_r, start_r + 3):
-        for c in range(start_c, start_c + 3):
-            if board[r][c] == val:
-                return False
-    return True
+def undo(domains, trail, mark, bit):
+    """Put value bit back into the domains of the cells on the trail after position mark."""
+    while len(trail) > mark:
+        domains[trail.pop()] |= bit
 
 
-def forward_check(board, domains, row, col, val):
+def forward_check(domains, cell, val, trail):
     """
     Forward checking:
-    After assigning val to (row, col), remove val from domains of
+    After assigning val to cell, remove val from domains of
     related unassigned cells (same row, col, and block).
-    Returns new_domains or None if any domain becomes empty.
+    Domains are updated in place and the index of every cell that lost
+    val is pushed on the trail; only unassigned cells' domains are ever read.
+    Returns False (with the domains rolled back) if any domain becomes empty.
     """
-    new_domains = copy.deepcopy(domains)
-    new_domains[(row, col)] = {val}
-    board[row][col] = val  # <-- FIX: assign before propagation
-
-    for k in range(9):
-        # Row
-        if board[row][k] == 0 and val in new_domains[(row, k)]:
-            new_domains[(row, k)].discard(val)
-            if not new_domains[(row, k)]:
-                board[row][col] = 0  # undo before returning
-                return None
-        # Column
-        if board[k][col] == 0 and val in new_domains[(k, col)]:
-            new_domains[(k, col)].discard(val)
-            if not new_domains[(k, col)]:
-                board[row][col] = 0
-                return None
-
-    # 3x3 block
-    start_r, start_c = 3 * (row // 3), 3 * (col // 3)
-    for r in range(start_r, start_r + 3):
-        for c in range(start_c, start_c + 3):
-            if board[r][c] == 0 and val in new_domains[(r, c)]:
-                new_domains[(r, c)].discard(val)
-                if not new_domains[(r, c)]:
-                    board[row][col] = 0
-                    return None
-
-    board[row][col] = 0  # <-- restore before returning
-    return new_domains
-
-
-def solve_sudoku(board, domains):
-    """Recursive backtracking solver with MRV + forward checking."""
-    cell = find_unassigned_mrv(board, domains)
+    mark = len(trail)
+    bit = 1 << val
+    for i in PEERS[cell]:
+        mask = domains[i]
+        if mask & bit:
+            trail.append(i)
+            mask &= ~bit
+            domains[i] = mask
+            if not mask:
+                undo(domains, trail, mark, bit)
+                return False
+    return True
+
+
+def solve_sudoku(board, domains, trail=None):
+    """
+    Backtracking solver with MRV + forward checking, iterating over an
+    explicit stack instead of recursing. Each frame is [cell, values not yet
+    tried there, trail mark, bit of the value placed (0 if none), cell's domain];
+    the cell's mask is emptied while its frame is on the stack.
+    """
+    if trail is None:
+        trail = []
+    if any(not board[i] and not domains[i] for i in range(81)):
+        return False  # an empty cell without candidates
+    cell = find_unassigned_mrv(domains)
     if cell is None:
         return True  # Solved
 
-    row, col = cell
-    for val in sorted(domains[(row, col)]):
-        if is_valid(board, row, col, val):
-            new_domains = forward_check(board, domains, row, col, val)
-            if new_domains is None:
-                continue  # invalid move
-            board[row][col] = val
-            if solve_sudoku(board, new_domains):
-                return True
-            board[row][col] = 0  # backtrack
+    stack = [[cell, domains[cell], len(trail), 0, domains[cell]]]
+    domains[cell] = 0
+    while stack:
+        frame = stack[-1]
+        cell, candidates, mark, bit, domain = frame
+        if bit:
+            board[cell] = 0  # backtrack
+            undo(domains, trail, mark, bit)
+        if not candidates:
+            domains[cell] = domain
+            stack.pop()
+            continue
+
+        bit = candidates & -candidates  # lowest remaining value first
+        frame[1] = candidates ^ bit
+        val = bit.bit_length() - 1
+        # Forward checking keeps every value left in an unassigned cell's
+        # domain consistent with its assigned peers: no re-check against the board
+        if not forward_check(domains, cell, val, trail):
+            frame[3] = 0
+            continue  # invalid move
+        frame[3] = bit
+        board[cell] = val
+
+        cell = find_unassigned_mrv(domains)
+        if cell is None:
+            return True  # Solved
+        stack.append([cell, domains[cell], len(trail), 0, domains[cell]])
+        domains[cell] = 0
     return False
 
 
 def initialize_domains(board):
-    """Initialize domains for each variable based on current board."""
-    domains = {}
-    for i in range(9):
-        for j in range(9):
-            if board[i][j] != 0:
-                domains[(i, j)] = {board[i][j]}
-            else:
-                domains[(i, j)] = {v for v in range(1, 10) if is_valid(board, i, j, v)}
+    """
+    Initialize domains for each variable based on current board.
+    Bit v of domains[cell] is set when v is still a possible value;
+    given cells get an empty mask.
+    """
+    domains = [0] * 81
+    for i in range(81):
+        if board[i] == 0:
+            used = 0  # empty peers set bit 0, which ALL_VALUES masks off
+            for p in PEERS[i]:
+                used |= 1 << board[p]
+            domains[i] = ALL_VALUES & ~used
     return domains
 
 
+def solve(board):
+    """
+    Solve a 9x9 board (lists of rows, 0 = empty).
+    Returns the solved board as a new list of rows, or None if unsolvable.
+    """
+    cells = [v for row in board for v in row]
+    if not solve_sudoku(cells, initialize_domains(cells)):
+        return None
+    return [cells[r * 9:r * 9 + 9] for r in range(9)]
+
+
 # ---------------------- Main entry ----------------------
 
 if __name__ == "__main__":
@@ -154,13 +191,12 @@ if __name__ == "__main__":
     print_board(board)
 
     start_time = time.perf_counter()
-    domains = initialize_domains(board)
-    solved = solve_sudoku(board, domains)
+    solution = solve(board)
     end_time = time.perf_counter()
 
-    if solved:
+    if solution is not None:
         print("Solved Sudoku:")
-        print_board(board)
+        print_board(solution)
     else:
         print("No solution found.")
 
@@ -1,9 +1,16 @@
-import time
 import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import matplotlib.pyplot as plt
 import numpy as np
 from walksat import WalkSATSolver
 
+# Optional: psutil tells physical cores from SMT siblings; without it trials run serially
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
 # --- EXPERIMENTAL CONFIGURATION ---
 # Adjusted to balance statistical significance with runtime [cite: 43]
 TRIALS_PER_POINT = 20       # Sufficient sample size for student projects
@@ -16,41 +23,54 @@ VAR_COUNTS = [20, 40, 60, 80, 100]
 RATIO_HARD = 4.26           # Phase transition (for Noise Experiment)
 RATIO_EASY = 3.5            # Under-constrained (for Scalability Experiment)
 
-def generate_random_3sat(n_vars, clause_ratio):
-    """Generates a random 3-SAT instance."""
+# Parallelism and seeding: every trial gets its own child seed, so results
+# are reproducible for a fixed SEED regardless of how trials map to workers.
+# Trials are timed while others run, so at most one worker per physical core;
+# runtimes measured with WORKERS > 1 are not comparable to serial (WORKERS = 1) ones
+WORKERS = (psutil.cpu_count(logical=False) if psutil is not None else None) or 1
+SEED = None                 # Set an int for reproducible runs
+SEEDS = np.random.SeedSequence(SEED)
+
+def generate_random_3sat(n_vars, clause_ratio, rng=None):
+    """Generates a random 3-SAT instance (3 distinct variables per clause, random signs)."""
+    if rng is None:
+        rng = np.random.default_rng()
     n_clauses = int(n_vars * clause_ratio)
-    clauses = []
-    for _ in range(n_clauses):
-        vars_in_clause = random.sample(range(1, n_vars + 1), 3)
-        clause = [v if random.random() > 0.5 else -v for v in vars_in_clause]
-        clauses.append(clause)
-    return clauses
+    # The 3 smallest of n_vars random keys per row = 3 distinct variables, all clauses at once
+    vars_in_clauses = np.argpartition(rng.random((n_clauses, n_vars)), 2, axis=1)[:, :3] + 1
+    signs = np.where(rng.random((n_clauses, 3)) > 0.5, 1, -1)
+    return (vars_in_clauses * signs).tolist()
+
+def _one_trial(args):
+    """One WalkSAT run on a fresh instance; returns (duration, solved). Runs in a worker."""
+    n_vars, p, ratio, seed = args
+    rng = np.random.default_rng(seed)
+    random.seed(int(rng.integers(2**32)))  # WalkSATSolver draws from the random module
+    clauses = generate_random_3sat(n_vars, clause_ratio=ratio, rng=rng)
+    solver = WalkSATSolver()
+    solver.load_from_list(clauses, n_vars)
+    
+    start = time.perf_counter()
+    result = solver.solve(max_flips=MAX_FLIPS, max_tries=MAX_TRIES, p=p)
+    duration = time.perf_counter() - start
+    return duration, bool(result)
 
-def run_trials(n_vars, p, ratio, num_trials):
-    """Runs multiple trials on FRESH instances to get avg runtime."""
+def run_trials(n_vars, p, ratio, num_trials, pool):
+    """Runs multiple trials on FRESH instances, spread over pool, to get avg runtime."""
     success_times = []
     success_count = 0
+    jobs = [(n_vars, p, ratio, seed) for seed in SEEDS.spawn(num_trials)]
 
-    for i in range(num_trials):
-        clauses = generate_random_3sat(n_vars, clause_ratio=ratio)
-        solver = WalkSATSolver()
-        solver.load_from_list(clauses, n_vars)
-        
-        start = time.time()
-        result = solver.solve(max_flips=MAX_FLIPS, max_tries=MAX_TRIES, p=p)
-        duration = time.time() - start
-        
-        if result:
+    for future in as_completed([pool.submit(_one_trial, job) for job in jobs]):
+        duration, solved = future.result()
+        if solved:
             success_count += 1
             success_times.append(duration)
-        
-        # Simple progress indicator
-        print(".", end="", flush=True)
 
     avg_time = np.mean(success_times) if success_times else 0
     return avg_time, success_count
 
-def benchmark_noise_sensitivity():
+def benchmark_noise_sensitivity(pool):
     """
     Experiment 1: Noise Sensitivity
     Uses HARD instances (ratio 4.26) to prove noise is needed to escape local minima.
@@ -60,8 +80,8 @@ def benchmark_noise_sensitivity():
     avg_times = []
     
     for p in NOISE_LEVELS:
-        print(f"\nTesting p={p}: ", end="")
-        avg_t, successes = run_trials(n_vars, p, RATIO_HARD, TRIALS_PER_POINT)
+        print(f"\nTesting p={p}: ", end="", flush=True)
+        avg_t, successes = run_trials(n_vars, p, RATIO_HARD, TRIALS_PER_POINT, pool)
         avg_times.append(avg_t)
         print(f" Time: {avg_t:.4f}s | Success: {successes}/{TRIALS_PER_POINT}")
 
@@ -76,7 +96,7 @@ def benchmark_noise_sensitivity():
     plt.savefig('walksat_noise.png')
     print("\nSaved 'walksat_noise.png'")
 
-def benchmark_scalability():
+def benchmark_scalability(pool):
     """
     Experiment 2: Scalability
     Uses EASIER instances (ratio 3.5) to isolate scaling behavior without timeouts.
@@ -86,8 +106,8 @@ def benchmark_scalability():
     times = []
     
     for n in VAR_COUNTS:
-        print(f"\nTesting N={n}: ", end="")
-        avg_t, successes = run_trials(n, p_optimal, RATIO_EASY, TRIALS_PER_POINT)
+        print(f"\nTesting N={n}: ", end="", flush=True)
+        avg_t, successes = run_trials(n, p_optimal, RATIO_EASY, TRIALS_PER_POINT, pool)
         times.append(avg_t)
         print(f" Time: {avg_t:.4f}s | Success: {successes}/{TRIALS_PER_POINT}")
 
@@ -101,6 +121,10 @@ def benchmark_scalability():
     print("\nSaved 'walksat_scalability.png'")
 
 if __name__ == "__main__":
-    benchmark_noise_sensitivity()
-    benchmark_scalability()
-    plt.show()
\ No newline at end of file
+    # One worker pool for all 13 benchmark points
+    with ProcessPoolExecutor(max_workers=WORKERS) as pool:
+        benchmark_noise_sensitivity(pool)
+        benchmark_scalability(pool)
+    # Both figures are already saved; only open windows under a GUI backend
+    if plt.get_backend().lower() != 'agg':
+        plt.show()
\ No newline at end of file
@@ -1,151 +1,400 @@
+import gc
 import random
+import re
 import sys
+import numpy as np
+
+# Optional compiled backend for solve(); the Python loop in WalkSATSolver is the fallback
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# solve() draws its per-flip random numbers from NumPy this many flips at a time
+RANDOM_BLOCK = 1024
+
+def luby(i):
+    """The i-th term (1-based) of the Luby restart sequence: 1, 1, 2, 1, 1, 2, 4, 1, ..."""
+    k = 1
+    while (1 << k) - 1 < i:
+        k += 1
+    if i == (1 << k) - 1:
+        return 1 << (k - 1)
+    return luby(i - (1 << (k - 1)) + 1)
+
+def restart_schedule(max_flips, max_tries, luby_base=None):
+    """
+    Flips allowed per try. Flat by default: max_tries tries of max_flips each.
+    With luby_base, try i gets luby_base * luby(i) flips instead, until the
+    same total budget of max_flips * max_tries flips is spent.
+    """
+    if luby_base is None:
+        return [max_flips] * max_tries
+    if not isinstance(luby_base, int) or luby_base <= 0:
+        raise ValueError(f"luby_base must be a positive int, got {luby_base!r}")
+    schedule = []
+    budget = max_flips * max_tries
+    while budget > 0:
+        schedule.append(min(budget, luby_base * luby(len(schedule) + 1)))
+        budget -= schedule[-1]
+    return schedule
+
+def _walksat_core(lit_vars, lit_pols, offsets, occ_clauses, occ_pols, occ_offsets,
+                  n_vars, schedule, p, seed):
+    """
+    The WalkSAT loop of WalkSATSolver.solve() over flat arrays only, so
+    numba can compile it. Clause c has the variables lit_vars[offsets[c]:offsets[c+1]]
+    with their signs at the same positions of lit_pols; the
+    clauses of variable v are occ_clauses[occ_offsets[v]:occ_offsets[v+1]]
+    with its sign in each at the same positions of occ_pols. Try i runs for
+    at most schedule[i] flips. Returns (solved, try_num, flip, assignment).
+    """
+    np.random.seed(seed)
+    n_clauses = len(offsets) - 1
+    assignment = np.zeros(n_vars + 1, dtype=np.bool_)
+    true_count = np.zeros(n_clauses, dtype=np.int64)
+    # Unsatisfied clauses as a list with O(1) removal: unsat[where[c]] == c
+    unsat = np.zeros(n_clauses, dtype=np.int64)
+    where = np.zeros(n_clauses, dtype=np.int64)
+
+    for try_num in range(len(schedule)):
+        for v in range(1, n_vars + 1):
+            assignment[v] = np.random.random() < 0.5
+
+        n_unsat = 0
+        for c in range(n_clauses):
+            count = 0
+            for k in range(offsets[c], offsets[c + 1]):
+                if assignment[lit_vars[k]] == lit_pols[k]:
+                    count += 1
+            true_count[c] = count
+            if count == 0:
+                unsat[n_unsat] = c
+                where[c] = n_unsat
+                n_unsat += 1
+
+        for flip in range(schedule[try_num]):
+            if n_unsat == 0:
+                return True, try_num, flip, assignment
+
+            c = unsat[np.random.randint(0, n_unsat)]
+            start = offsets[c]
+            size = offsets[c + 1] - start
+
+            if np.random.random() < p:
+                var_to_flip = lit_vars[start + np.random.randint(0, size)]
+            else:
+                # Minimum break count, ties broken uniformly by reservoir sampling
+                var_to_flip = 0
+                min_break = n_clauses + 1
+                n_ties = 0
+                for k in range(start, start + size):
+                    var = lit_vars[k]
+                    val = assignment[var]
+                    bk = 0
+                    for j in range(occ_offsets[var], occ_offsets[var + 1]):
+                        if occ_pols[j] == val and true_count[occ_clauses[j]] == 1:
+                            bk += 1
+                    if bk == 0:
+                        var_to_flip = var
+                        break
+                    if bk < min_break:
+                        min_break = bk
+                        var_to_flip = var
+                        n_ties = 1
+                    elif bk == min_break:
+                        n_ties += 1
+                        if np.random.random() * n_ties < 1.0:
+                            var_to_flip = var
+
+            val = not assignment[var_to_flip]
+            assignment[var_to_flip] = val
+            for j in range(occ_offsets[var_to_flip], occ_offsets[var_to_flip + 1]):
+                c = occ_clauses[j]
+                if occ_pols[j] == val:
+                    true_count[c] += 1
+                    if true_count[c] == 1:
+                        # Swap-remove c from the unsatisfied list
+                        n_unsat -= 1
+                        last = unsat[n_unsat]
+                        unsat[where[c]] = last
+                        where[last] = where[c]
+                else:
+                    true_count[c] -= 1
+                    if true_count[c] == 0:
+                        unsat[n_unsat] = c
+                        where[c] = n_unsat
+                        n_unsat += 1
+
+    return False, len(schedule), 0, assignment
+
+if njit is not None:
+    _walksat_core = njit(cache=True)(_walksat_core)
 
 class WalkSATSolver:
     def __init__(self):
-        self.clauses = []        # List of lists: [[1, -2, 3], ...]
+        self.clause_vars = []    # Variables of each clause: [[1, 2, 3], ...] (see also `clauses`)
         self.n_vars = 0          # Total number of variables
-        self.occurrence_map = {} # Map: variable -> [list of clause indices]
+        self.n_clauses = 0       # Number of stored clauses
+        self.has_empty_clause = False  # An empty input clause makes the formula unsatisfiable
+        # Map: variable -> ([clauses with -var], [clauses with +var]), so
+        # occurrence_map[v][value] lists the clauses where v is true under value
+        self.occurrence_map = {}
+
+        # Flat (CSR) copy of the clauses for vectorized evaluation:
+        # the literals of clause i live at [clause_offsets[i], clause_offsets[i+1])
+        self.lit_vars = None       # int32: variable of each literal
+        self.lit_pols = None       # bool: True for a positive literal
+        self.clause_offsets = None # int32, len(clauses) + 1
+        self.occ_clauses = None    # int32: occurrence_map flattened, variable by variable
+        self.occ_pols = None       # bool: sign of the variable in each of those clauses
+        self.occ_offsets = None    # int32, n_vars + 2: variable v at [occ_offsets[v], occ_offsets[v+1])
+
+    @property
+    def clauses(self):
+        """
+        The stored clauses as lists of literals: [[1, -2, 3], ...]. Built on
+        demand from the flat arrays; solve() never needs the signed lists.
+        """
+        if self.lit_vars is None:
+            return []
+        lits = np.where(self.lit_pols, self.lit_vars, -self.lit_vars).tolist()
+        bounds = self.clause_offsets.tolist()
+        return [lits[a:b] for a, b in zip(bounds, bounds[1:])]
     
     def load_dimacs(self, filename):
         """Parses a standard DIMACS .cnf file."""
         try:
             with open(filename, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or line.startswith('c'):
-                        continue
-                    if line.startswith('p'):
-                        parts = line.split()
-                        self.n_vars = int(parts[2])
-                        self._init_occurrence_map()
-                        continue
-                    
-                    # Read clauses (end with 0)
-                    parts = [int(x) for x in line.split() if x != '0']
-                    if parts:
-                        self.clauses.append(parts)
-                        clause_idx = len(self.clauses) - 1
-                        for lit in parts:
-                            self.occurrence_map[abs(lit)].append(clause_idx)
-                            
-            print(f"Loaded: {self.n_vars} variables, {len(self.clauses)} clauses.")
-            
+                text = f.read()
         except FileNotFoundError:
             print(f"Error: File {filename} not found.")
             sys.exit(1)
 
+        # SATLIB files end the formula with a '%' line
+        text = text.split('\n%', 1)[0]
+        header = re.search(r'^\s*p\s+cnf\s+(\d+)', text, re.M)
+        n_vars = int(header.group(1)) if header else 0
+
+        # Drop comment and header lines, then tokenize everything else in one C-level pass.
+        # Clauses end with 0 and may span lines or share one.
+        body = re.sub(r'^\s*[cp].*$', '', text, flags=re.M)
+        values = np.fromstring(body, dtype=np.int64, sep=' ')
+        ends = np.flatnonzero(values == 0)
+        lits = values[values != 0]
+        offsets = np.concatenate(([0], ends - np.arange(len(ends))))
+        if offsets[-1] < len(lits):
+            offsets = np.append(offsets, len(lits))  # last clause without its closing 0
+
+        self._load_literals(lits, offsets, n_vars)
+        print(f"Loaded: {self.n_vars} variables, {self.n_clauses} clauses.")
+
     def load_from_list(self, clauses, n_vars):
         """Loads a problem directly from a list (useful for testing)."""
-        self.clauses = clauses
+        lengths = [len(clause) for clause in clauses]
+        lits = np.fromiter((lit for clause in clauses for lit in clause),
+                           dtype=np.int64, count=sum(lengths))
+        offsets = np.zeros(len(clauses) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        self._load_literals(lits, offsets, n_vars)
+
+    def _load_literals(self, lits, offsets, n_vars):
+        """
+        Builds every clause structure from flat literals, clause i being
+        lits[offsets[i]:offsets[i+1]]. Repeated literals are dropped and
+        tautologies (x OR -x, which every assignment satisfies) are skipped,
+        so each stored clause has at most one literal per variable, which
+        the break count relies on. Empty clauses are not stored either;
+        they set has_empty_clause instead, and solve() then fails at once.
+        """
+        clause_ids = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        lit_vars = np.abs(lits)
+        if len(lits) and lit_vars.max() > n_vars:
+            raise ValueError(f"Literal {lit_vars.max()} exceeds the {n_vars} declared variables")
+
+        # Sorting by (clause, variable, literal) puts the literals on one variable next to
+        # each other; the stable sort keeps the first of each repeated literal in front
+        order = np.lexsort((lits, lit_vars, clause_ids))
+        s_clause, s_var, s_lit = clause_ids[order], lit_vars[order], lits[order]
+        same_var = (s_clause[1:] == s_clause[:-1]) & (s_var[1:] == s_var[:-1])
+        repeated = np.zeros(len(lits), dtype=bool)
+        repeated[order[1:][same_var & (s_lit[1:] == s_lit[:-1])]] = True
+        tautology = np.zeros(len(offsets) - 1, dtype=bool)
+        tautology[s_clause[1:][same_var & (s_lit[1:] != s_lit[:-1])]] = True
+
+        self.has_empty_clause = bool((np.diff(offsets) == 0).any())
+        kept = ~tautology & (np.diff(offsets) > 0)
+        keep = ~repeated & kept[clause_ids]
+        lits = lits[keep]
+        clause_ids = (np.cumsum(kept) - 1)[clause_ids[keep]]
+        n_clauses = int(kept.sum())
+
+        # Flat (CSR) arrays
         self.n_vars = n_vars
-        self._init_occurrence_map()
-        for idx, clause in enumerate(self.clauses):
-            for lit in clause:
-                self.occurrence_map[abs(lit)].append(idx)
-
-    def _init_occurrence_map(self):
-        """Initializes the mapping of variables to clauses for fast lookup."""
-        self.occurrence_map = {i: [] for i in range(1, self.n_vars + 1)}
-
-    def _evaluate_clause(self, clause, assignment):
-        """Returns True if the clause is satisfied by the assignment."""
-        for lit in clause:
-            # lit is > 0: True if assignment[lit] is True
-            # lit is < 0: True if assignment[abs(lit)] is False
-            val = assignment[abs(lit)]
-            if lit > 0 and val:
-                return True
-            if lit < 0 and not val:
-                return True
-        return False
-
-    def _calculate_break_count(self, target_var, assignment):
+        self.n_clauses = n_clauses
+        self.lit_vars = np.abs(lits).astype(np.int32)
+        self.lit_pols = lits > 0
+        self.clause_offsets = np.zeros(n_clauses + 1, dtype=np.int32)
+        np.cumsum(np.bincount(clause_ids, minlength=n_clauses), out=self.clause_offsets[1:])
+
+        # Occurrence lists: group the literals by key 2*var + sign, so each variable
+        # gets its clauses with -var, then those with +var
+        keys = 2 * self.lit_vars + self.lit_pols
+        order = np.argsort(keys, kind='stable')
+        self.occ_clauses = clause_ids[order].astype(np.int32)
+        self.occ_pols = self.lit_pols[order]
+        key_bounds = np.searchsorted(keys[order], np.arange(2, 2 * n_vars + 3))
+        self.occ_offsets = np.concatenate(([0], key_bounds[::2])).astype(np.int32)
+
+        # Python lists for the flip loop. Creating this many small lists would trigger
+        # the cyclic GC over and over, and none of them can form a cycle, so pause it
+        bounds = self.clause_offsets.tolist()
+        flat_vars = self.lit_vars.tolist()
+        kb, occ = key_bounds.tolist(), self.occ_clauses.tolist()
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self.clause_vars = [flat_vars[a:b] for a, b in zip(bounds, bounds[1:])]
+            self.occurrence_map = {v: (occ[kb[2*v - 2]:kb[2*v - 1]], occ[kb[2*v - 1]:kb[2*v]])
+                                   for v in range(1, n_vars + 1)}
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    def _true_counts(self, assignment):
+        """
+        Evaluates every clause at once: returns the number of true
+        literals in each clause as a list (0 means unsatisfied).
+        """
+        if not self.n_clauses:
+            return []
+        lit_true = np.array(assignment)[self.lit_vars] == self.lit_pols
+        return np.add.reduceat(lit_true, self.clause_offsets[:-1], dtype=np.intp).tolist()
+
+    def _calculate_break_count(self, target_var, assignment, true_count):
         """
         Calculates 'break count': The number of clauses that are CURRENTLY 
-        satisfied but will become UNSATISFIED if we flip target_var.
+        satisfied but will become UNSATISFIED if we flip target_var, i.e.
+        clauses whose only true literal is the one on target_var.
         """
         break_count = 0
-        
-        # Only check clauses that actually contain this variable
-        relevant_clauses_indices = self.occurrence_map[target_var]
-        
-        for clause_idx in relevant_clauses_indices:
-            clause = self.clauses[clause_idx]
-            
-            # Check if this clause is CURRENTLY satisfied
-            is_satisfied = self._evaluate_clause(clause, assignment)
-            
-            if is_satisfied:
-                # If we flip target_var, does it become unsatisfied?
-                # Temporarily flip the variable in our mind (or copy)
-                current_val = assignment[target_var]
-                assignment[target_var] = not current_val # Flip
-                
-                if not self._evaluate_clause(clause, assignment):
-                    break_count += 1
-                
-                assignment[target_var] = current_val # Flip back
-                
+        for clause_idx in self.occurrence_map[target_var][assignment[target_var]]:
+            if true_count[clause_idx] == 1:
+                break_count += 1
         return break_count
 
-    def solve(self, max_flips=10000, max_tries=10, p=0.5):
+    def _flip(self, var, assignment, true_count, unsatisfied, unsat_pos):
+        """
+        Flips var, updating only the true counts of the clauses it occurs in.
+        unsatisfied is a list of clause indices with unsat_pos[c] giving the
+        position of c in it, so clauses leave by swapping with the last one.
+        """
+        val = not assignment[var]
+        assignment[var] = val
+        occurrences = self.occurrence_map[var]
+        for clause_idx in occurrences[val]:    # var's literal just became true
+            true_count[clause_idx] += 1
+            if true_count[clause_idx] == 1:
+                last = unsatisfied.pop()
+                if last != clause_idx:
+                    unsatisfied[unsat_pos[clause_idx]] = last
+                    unsat_pos[last] = unsat_pos[clause_idx]
+        for clause_idx in occurrences[not val]:
+            true_count[clause_idx] -= 1
+            if true_count[clause_idx] == 0:
+                unsat_pos[clause_idx] = len(unsatisfied)
+                unsatisfied.append(clause_idx)
+
+    def _solve_compiled(self, schedule, p):
+        """solve() through the numba kernel; seeded from `random` so runs stay reproducible."""
+        solved, try_num, flip, assignment = _walksat_core(
+            self.lit_vars, self.lit_pols, self.clause_offsets,
+            self.occ_clauses, self.occ_pols, self.occ_offsets,
+            self.n_vars, np.array(schedule, dtype=np.int64), p, random.getrandbits(32))
+        if not solved:
+            print("\nFailure: Max flips reached without finding a solution.")
+            return None
+        print(f"\nSolution found on Try {try_num+1}, Flip {flip}!")
+        return {i: bool(assignment[i]) for i in range(1, self.n_vars + 1)}
+
+    def solve(self, max_flips=10000, max_tries=10, p=0.5, luby_base=None):
         """
         The main WalkSAT Algorithm.
         :param max_flips: Max changes before restarting.
         :param max_tries: How many fresh restarts to try.
         :param p: Probability of making a random move (noise).
+        :param luby_base: If set, restart on the Luby schedule (luby_base * 1, 1, 2, 1, 1, 2, 4, ...
+            flips per try) within the same max_flips * max_tries budget.
         """
         print(f"Starting WalkSAT (Max Flips: {max_flips}, Noise p: {p})...")
 
-        for try_num in range(max_tries):
+        schedule = restart_schedule(max_flips, max_tries, luby_base)
+        if self.has_empty_clause:
+            print("\nFailure: The formula has an empty clause, so it is unsatisfiable.")
+            return None
+        if njit is not None:
+            return self._solve_compiled(schedule, p)
+
+        # Seeded from `random`, so random.seed() still makes runs reproducible
+        rng = np.random.default_rng(random.getrandbits(64))
+
+        for try_num, try_flips in enumerate(schedule):
             # 1. Start with a random assignment
-            # (1-indexed map: 1->True, 2->False...)
-            assignment = {i: random.choice([True, False]) for i in range(1, self.n_vars + 1)}
+            # (indexed by variable: assignment[1] -> True, ...; slot 0 unused)
+            assignment = [False] + (rng.random(self.n_vars) < 0.5).tolist()
+
+            # 2. Count true literals per clause once; flips keep it up to date
+            true_count = self._true_counts(assignment)
+            unsatisfied = [idx for idx, count in enumerate(true_count) if count == 0]
+            unsat_pos = [0] * len(true_count)
+            for pos, idx in enumerate(unsatisfied):
+                unsat_pos[idx] = pos
             
-            for flip in range(max_flips):
-                # 2. Find all unsatisfied clauses
-                unsatisfied_indices = []
-                for idx, clause in enumerate(self.clauses):
-                    if not self._evaluate_clause(clause, assignment):
-                        unsatisfied_indices.append(idx)
-                
+            for flip in range(try_flips):
+                block_pos = flip % RANDOM_BLOCK
+                if block_pos == 0:
+                    # Clause pick, walk-or-greedy decision and walk variable for the next block
+                    clause_draws, var_draws = rng.random((2, RANDOM_BLOCK)).tolist()
+                    walks = (rng.random(RANDOM_BLOCK) < p).tolist()
+
                 # SUCCESS CHECK: If no unsatisfied clauses, we found a solution!
-                if not unsatisfied_indices:
+                if not unsatisfied:
                     print(f"\nSolution found on Try {try_num+1}, Flip {flip}!")
-                    return assignment
+                    return {i: assignment[i] for i in range(1, self.n_vars + 1)}
 
                 # 3. Pick a random unsatisfied clause
-                target_clause_idx = random.choice(unsatisfied_indices)
-                target_clause = self.clauses[target_clause_idx]
+                target_clause_idx = unsatisfied[int(clause_draws[block_pos] * len(unsatisfied))]
+                target_vars = self.clause_vars[target_clause_idx]
 
                 # 4. Choose which variable to flip
                 # Logic: With probability p, random pick. Else, greedy pick.
                 
-                if random.random() < p:
+                if walks[block_pos]:
                     # Random Walk: Pick any variable from the clause
-                    var_to_flip = abs(random.choice(target_clause))
+                    var_to_flip = target_vars[int(var_draws[block_pos] * len(target_vars))]
                 else:
                     # Greedy Step: Pick variable with minimum 'break count'
-                    best_var = None
+                    best_vars = []
                     min_break = float('inf')
                     
-                    candidates = [abs(lit) for lit in target_clause]
-                    
-                    for var in candidates:
-                        bk = self._calculate_break_count(var, assignment)
+                    for var in target_vars:
+                        bk = self._calculate_break_count(var, assignment, true_count)
+                        if bk == 0:
+                            # A 'freebie' breaks nothing, so no other candidate can beat it
+                            best_vars = [var]
+                            break
                         if bk < min_break:
                             min_break = bk
-                            best_var = var
+                            best_vars = [var]
                         elif bk == min_break:
-                            # Tie-breaking: random choice usually helps avoid loops
-                            if random.random() < 0.5:
-                                best_var = var
+                            best_vars.append(var)
                     
-                    var_to_flip = best_var
+                    # Tie-breaking: uniform over the tied variables usually helps avoid loops
+                    # (this flip's walk draw is unused on the greedy branch)
+                    var_to_flip = best_vars[int(var_draws[block_pos] * len(best_vars))]
 
                 # 5. Flip the variable
-                assignment[var_to_flip] = not assignment[var_to_flip]
+                self._flip(var_to_flip, assignment, true_count, unsatisfied, unsat_pos)
                 
         print("\nFailure: Max flips reached without finding a solution.")
         return None
@@ -13,7 +13,7 @@ import os
 import sys
 import csv
 import subprocess
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import Tuple, List, Dict
@@ -121,23 +121,34 @@ def run_solver(solver_path: str, cnf_file: str, timeout: int = 180) -> Tuple[str
         print(f"Error running {solver_path} on {cnf_file}: {e}")
         return ('ERROR', 0, 0, 0, 0, 0, 0)
 
-def benchmark(instances_dir: str, output_csv: str, build_dir: str = 'build', timeout: int = 180) -> None:
+def benchmark(instances_dir: str, output_csv: str, build_dir: str = 'build', timeout: int = 180,
+              workers: int = 1) -> None:
     """
     Benchmark all compiled SAT solvers on all CNF instances in a directory.
     
     This function orchestrates the complete benchmarking process:
     1. Discovers all .cnf files in the instances directory
     2. Iterates through all solver binaries
-    3. Runs each solver on each instance with timeout
+    3. Runs each solver on each instance with timeout, up to `workers` runs at once
     4. Writes performance metrics to a CSV file
     
     The function provides real-time progress feedback and handles missing binaries gracefully.
+    If output_csv already holds results from an earlier (e.g. interrupted) sweep, the new
+    rows are appended and every (instance, solver) pair already in it is skipped, except
+    TIMEOUT rows recorded under a shorter timeout: those are removed and run again.
+    Every run is its own solver process, so a thread pool is enough to run several at
+    once; rows are still written in (instance, solver) order. Runs are serial by default:
+    concurrent runs compete for cores and memory bandwidth, which inflates the reported
+    times and can turn runs near the limit into timeouts.
     
     Args:
         instances_dir (str): Directory containing .cnf instance files
         output_csv (str): Output CSV file path for benchmark results
         build_dir (str): Directory containing compiled solver binaries (default: 'build')
         timeout (int): Per-instance timeout in seconds (default: 180)
+        workers (int): Maximum concurrent solver runs (default: 1). Values above 1
+            speed up the sweep but skew the measured times; keep it at or below
+            the number of physical cores if you raise it.
     
     Returns:
         None: Results are written to output_csv file
@@ -150,7 +161,10 @@ def benchmark(instances_dir: str, output_csv: str, build_dir: str = 'build', tim
         benchmark('datasets/uf20', 'results/uf20_bench.csv', timeout=60)
     """
     # Get all CNF files
-    cnf_files = sorted(glob.glob(os.path.join(instances_dir, '*.cnf')))
+    with os.scandir(instances_dir) as entries:
+        cnf_files = sorted(entry.path for entry in entries
+                           if entry.name.endswith('.cnf') and not entry.name.startswith('.')
+                           and entry.is_file())
     
     if not cnf_files:
         print(f"No CNF files found in {instances_dir}")
@@ -160,66 +174,108 @@ def benchmark(instances_dir: str, output_csv: str, build_dir: str = 'build', tim
     print(f"Running {len(SOLVERS)} solvers with {timeout}s timeout")
     print("-" * 80)
     
-    # Open CSV file
-    with open(output_csv, 'w', newline='') as csvfile:
-        fieldnames = [
-            'instance',
-            'solver',
-            'solver_name',
-            'result',
-            'time_seconds',
-            'max_recursion_depth',
-            'memory_kb',
-            'num_decisions',
-            'num_backtracks',
-            'timeout'
-        ]
+    fieldnames = [
+        'instance',
+        'solver',
+        'solver_name',
+        'result',
+        'time_seconds',
+        'max_recursion_depth',
+        'memory_kb',
+        'num_decisions',
+        'num_backtracks',
+        'timeout'
+    ]
+    
+    # Runs already recorded by an earlier sweep into the same file. A TIMEOUT under a
+    # shorter limit than this sweep's is run again, and its old row is dropped first
+    done = set()
+    if os.path.isfile(output_csv):
+        with open(output_csv, newline='') as f:
+            reader = csv.DictReader(f)
+            rows = list(reader) if reader.fieldnames == fieldnames else []
+        kept = [row for row in rows
+                if row['result'] != 'TIMEOUT' or float(row['time_seconds']) >= timeout]
+        if kept and len(kept) < len(rows):
+            print(f"Retrying {len(rows) - len(kept)} runs that timed out under a shorter limit")
+            tmp_csv = output_csv + '.tmp'
+            with open(tmp_csv, 'w', newline='') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                writer.writerows(kept)
+            os.replace(tmp_csv, output_csv)
+        done = {(row['instance'], row['solver']) for row in kept}
+        if done:
+            print(f"Resuming: {len(done)} runs already in {output_csv}")
+    
+    # Open CSV file, line-buffered so every row reaches the file as soon as it is written
+    # and a crashed or interrupted sweep keeps all finished runs
+    with open(output_csv, 'a' if done else 'w', newline='', buffering=1) as csvfile, \
+            ThreadPoolExecutor(max_workers=workers) as pool:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+        if not done:
+            writer.writeheader()
         
         total_runs = len(cnf_files) * len(SOLVERS)
         current_run = 0
         
-        # Run each solver on each instance
+        # Start every (instance, solver) run up front; the pool caps how many run at once
+        runs = {}
         for cnf_file in cnf_files:
-            instance_name = os.path.basename(cnf_file)
-            print(f"\nInstance: {instance_name}")
-            
             for solver in SOLVERS:
-                current_run += 1
                 solver_path = os.path.join(build_dir, solver)
+                if (os.path.basename(cnf_file), solver) not in done and os.path.exists(solver_path):
+                    runs[cnf_file, solver] = pool.submit(run_solver, solver_path, cnf_file, timeout)
+        
+        # Collect the results in order. On Ctrl-C or an error, drop the queued runs
+        # instead of letting the pool finish the whole sweep
+        try:
+            for cnf_file in cnf_files:
+                instance_name = os.path.basename(cnf_file)
+                print(f"\nInstance: {instance_name}")
                 
-                if not os.path.exists(solver_path):
-                    print(f"  [{current_run}/{total_runs}] {solver}: MISSING BINARY")
-                    continue
-                
-                print(f"  [{current_run}/{total_runs}] {solver}...", end=' ', flush=True)
-                
-                result, time, depth, memory, decisions, backtracks, timeout_flag = \
-                    run_solver(solver_path, cnf_file, timeout)
-                
-                # Write to CSV
-                writer.writerow({
-                    'instance': instance_name,
-                    'solver': solver,
-                    'solver_name': SOLVER_NAMES[solver],
-                    'result': result,
-                    'time_seconds': f'{time:.6f}',
-                    'max_recursion_depth': depth,
-                    'memory_kb': memory,
-                    'num_decisions': decisions,
-                    'num_backtracks': backtracks,
-                    'timeout': timeout_flag
-                })
-                
-                # Print result
-                if result == 'TIMEOUT':
-                    print(f"TIMEOUT ({timeout}s)")
-                elif result == 'ERROR':
-                    print("ERROR")
-                else:
-                    print(f"{result} ({time:.4f}s, {decisions} decisions, {backtracks} backtracks)")
-    
+                for solver in SOLVERS:
+                    current_run += 1
+                    
+                    if (instance_name, solver) in done:
+                        print(f"  [{current_run}/{total_runs}] {solver}: already done")
+                        continue
+                    
+                    if (cnf_file, solver) not in runs:
+                        print(f"  [{current_run}/{total_runs}] {solver}: MISSING BINARY")
+                        continue
+                    
+                    print(f"  [{current_run}/{total_runs}] {solver}...", end=' ', flush=True)
+                    
+                    result, time, depth, memory, decisions, backtracks, timeout_flag = \
+                        runs[cnf_file, solver].result()
+                    
+                    # Write to CSV
+                    writer.writerow({
+                        'instance': instance_name,
+                        'solver': solver,
+                        'solver_name': SOLVER_NAMES[solver],
+                        'result': result,
+                        'time_seconds': f'{time:.6f}',
+                        'max_recursion_depth': depth,
+                        'memory_kb': memory,
+                        'num_decisions': decisions,
+                        'num_backtracks': backtracks,
+                        'timeout': timeout_flag
+                    })
+                    
+                    # Print result
+                    if result == 'TIMEOUT':
+                        print(f"TIMEOUT ({timeout}s)")
+                    elif result == 'ERROR':
+                        print("ERROR")
+                    else:
+                        print(f"{result} ({time:.4f}s, {decisions} decisions, {backtracks} backtracks)")
+        
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
     print("\n" + "=" * 80)
     print(f"Benchmarking complete! Results saved to {output_csv}")
 
@@ -231,12 +287,13 @@ def main() -> None:
     and initiates the benchmarking process.
     
     Command-Line Usage:
-        python benchmark.py <instances_dir> [output.csv] [timeout_seconds]
+        python benchmark.py <instances_dir> [output.csv] [timeout_seconds] [workers]
     
     Arguments:
         instances_dir (required): Directory containing CNF instance files
         output.csv (optional): Output CSV filename (default: benchmark_results_TIMESTAMP.csv)
         timeout_seconds (optional): Timeout per instance in seconds (default: 180)
+        workers (optional): Maximum concurrent solver runs (default: 1; more skews timings)
     
     Examples:
         python benchmark.py datasets/uf20
@@ -253,7 +310,7 @@ def main() -> None:
         - Python 3.9+ with standard library
     """
     if len(sys.argv) < 2:
-        print("Usage: python benchmark.py <instances_directory> [output.csv] [timeout_seconds]")
+        print("Usage: python benchmark.py <instances_directory> [output.csv] [timeout_seconds] [workers]")
         print("\nExample:")
         print("  python benchmark.py ../sat_solver/instances results.csv 60")
         sys.exit(1)
@@ -261,6 +318,7 @@ def main() -> None:
     instances_dir = sys.argv[1]
     output_csv = sys.argv[2] if len(sys.argv) > 2 else f'benchmark_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
     timeout = int(sys.argv[3]) if len(sys.argv) > 3 else 180
+    workers = int(sys.argv[4]) if len(sys.argv) > 4 else 1
     
     if not os.path.isdir(instances_dir):
         print(f"Error: Directory '{instances_dir}' not found")
@@ -288,7 +346,7 @@ def main() -> None:
         if response.lower() != 'y':
             sys.exit(1)
     
-    benchmark(instances_dir, output_csv, build_dir, timeout)
+    benchmark(instances_dir, output_csv, build_dir, timeout, workers)
 
 if __name__ == '__main__':
     main()
@@ -4,7 +4,12 @@ Advanced Analysis Plots for SAT Solver Benchmarking
 Generates additional insightful visualizations beyond the basic 8 plots
 """
 
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # plots are only written to files; no GUI backend needed
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
@@ -19,7 +24,7 @@ sns.set_palette("husl")
 
 # Configure matplotlib
 plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
+plt.rcParams['savefig.dpi'] = 150  # layout is fixed at draw time, so no bbox_inches='tight' pass
 plt.rcParams['font.family'] = 'serif'
 plt.rcParams['font.serif'] = ['Times New Roman', 'DejaVu Serif']
 plt.rcParams['font.size'] = 10
@@ -41,13 +46,15 @@ SOLVER_COLORS = {
     'random': '#17becf', 'cdcl_solver': '#ff1493'
 }
 
-def load_data():
-    """Load all benchmark data"""
-    print("Loading benchmark data...")
-    
-    uf20 = pd.read_csv('results/uf20_benchmark.csv')
-    uf50 = pd.read_csv('results/uf50_benchmark.csv')
-    uf100 = pd.read_csv('results/uf100_benchmark.csv')
+BENCHMARK_CSVS = ['results/uf20_benchmark.csv', 'results/uf50_benchmark.csv',
+                  'results/uf100_benchmark.csv']
+CACHE_FILE = 'results/_cache/combined.pkl'  # filtered frame, rebuilt when a CSV or this script changes
+
+def _read_benchmarks():
+    """Parse and filter the three benchmark CSVs"""
+    # Parse the three CSVs side by side; pandas' C parser releases the GIL
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        uf20, uf50, uf100 = pool.map(pd.read_csv, BENCHMARK_CSVS)
     
     uf20['dataset'] = 'UF20 (20 vars)'
     uf50['dataset'] = 'UF50 (50 vars)'
@@ -59,84 +66,110 @@ def load_data():
     
     df = pd.concat([uf20, uf50, uf100], ignore_index=True)
     df['time_seconds'] = pd.to_numeric(df['time_seconds'], errors='coerce')
-    df = df[df['timeout'] == 0]
-    df = df[df['result'].isin(['SAT', 'UNSAT'])]
+    df = df.loc[(df['timeout'] == 0) & df['result'].isin(['SAT', 'UNSAT'])].reset_index(drop=True)
+    
+    # Derived ratios, left undefined (NaN) where the denominator is zero so those
+    # runs drop out of the per-solver medians
+    t = df['time_seconds'].to_numpy(dtype=np.float64)
+    bt = df['num_backtracks'].to_numpy(dtype=np.float64)
+    dec = df['num_decisions'].to_numpy(dtype=np.float64)
+    df = df.assign(
+        time_per_backtrack=np.divide(t, bt, out=np.full(len(df), np.nan), where=bt > 0),
+        backtracks_per_decision=np.divide(bt, dec, out=np.full(len(df), np.nan), where=dec > 0))
+    
+    # Repeated labels as categoricals: groupby and comparisons work on integer codes
+    for col in ('solver', 'solver_name', 'dataset', 'result'):
+        df[col] = df[col].astype('category')
+    df['num_vars'] = df['num_vars'].astype(np.int16)
     
     return df
 
-def plot_a1_backtrack_efficiency(df):
+def _cached_load(cache=CACHE_FILE):
+    """_read_benchmarks() with an on-disk cache, reused while it is newer than its inputs"""
+    try:
+        if os.path.getmtime(cache) >= max(os.path.getmtime(f) for f in [*BENCHMARK_CSVS, __file__]):
+            return pd.read_pickle(cache)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # missing, stale or unreadable cache: parse again
+    
+    df = _read_benchmarks()
+    try:
+        Path(cache).parent.mkdir(parents=True, exist_ok=True)
+        df.to_pickle(cache)
+    except OSError:
+        pass  # read-only results folder: just skip caching
+    return df
+
+def load_data():
+    """Load all benchmark data"""
+    print("Loading benchmark data...")
+    return _cached_load()
+
+def summarize_solvers(df):
+    """Per (dataset, solver) summary shared by the plots"""
+    return df.groupby(['dataset', 'solver'], observed=True, sort=False).agg(
+        time_med=('time_seconds', 'median'),
+        time_mean=('time_seconds', 'mean'),
+        time_std=('time_seconds', 'std'),
+        dec_med=('num_decisions', 'median'),
+        tpb_med=('time_per_backtrack', 'median'),
+        tpb_std=('time_per_backtrack', 'std'),
+        bpd_med=('backtracks_per_decision', 'median'),
+        num_vars=('num_vars', 'first'),
+        solver_name=('solver_name', 'first'))
+
+def plot_a1_backtrack_efficiency(agg_all, df_by_ds):
     """Plot A1: Backtrack Efficiency - Time per Backtrack"""
     print("\nGenerating Advanced Plot A1: Backtrack Efficiency...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 5), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset].copy()
-        
-        # Calculate time per backtrack (excluding solvers with 0 backtracks)
-        dataset_data = dataset_data[dataset_data['num_backtracks'] > 0]
-        dataset_data['time_per_backtrack'] = dataset_data['time_seconds'] / dataset_data['num_backtracks']
-        
-        solver_stats = dataset_data.groupby('solver').agg({
-            'time_per_backtrack': ['median', 'std'],
-            'solver_name': 'first'
-        }).reset_index()
         
-        solver_stats.columns = ['solver', 'median_tpb', 'std_tpb', 'solver_name']
-        solver_stats = solver_stats.sort_values('median_tpb')
+        # Time per backtrack (solvers that never backtracked have no value)
+        solver_stats = agg_all.loc[dataset].dropna(subset=['tpb_med']).sort_values('tpb_med')
         
         x = range(len(solver_stats))
-        colors = [SOLVER_COLORS.get(s, '#666666') for s in solver_stats['solver']]
+        colors = [SOLVER_COLORS.get(s, '#666666') for s in solver_stats.index]
         
-        ax.bar(x, solver_stats['median_tpb'] * 1000, yerr=solver_stats['std_tpb'] * 1000,
+        ax.bar(x, solver_stats['tpb_med'] * 1000, yerr=solver_stats['tpb_std'] * 1000,
                capsize=3, alpha=0.8, color=colors, edgecolor='black', linewidth=0.5)
         
         ax.set_xticks(x)
-        ax.set_xticklabels(solver_stats['solver'], rotation=45, ha='right')
+        ax.set_xticklabels(solver_stats.index, rotation=45, ha='right')
         ax.set_ylabel('Time per Backtrack (ms)')
         ax.set_title(dataset, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
     
     plt.suptitle('Backtracking Efficiency: Time Cost per Backtrack Operation', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A01_backtrack_efficiency.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A01_backtrack_efficiency.png')
     plt.close()
     print("  ✓ Saved: A01_backtrack_efficiency.png")
 
-def plot_a2_decision_quality(df):
+def plot_a2_decision_quality(agg_all, df_by_ds):
     """Plot A2: Decision Quality - Backtracks per Decision"""
     print("\nGenerating Advanced Plot A2: Decision Quality...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 5), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset].copy()
         
-        # Calculate backtracks per decision (decision quality metric)
-        dataset_data = dataset_data[dataset_data['num_decisions'] > 0]
-        dataset_data['backtracks_per_decision'] = dataset_data['num_backtracks'] / dataset_data['num_decisions']
-        
-        solver_stats = dataset_data.groupby('solver').agg({
-            'backtracks_per_decision': ['median', 'mean'],
-            'solver_name': 'first'
-        }).reset_index()
-        
-        solver_stats.columns = ['solver', 'median_bpd', 'mean_bpd', 'solver_name']
-        solver_stats = solver_stats.sort_values('median_bpd')
+        # Backtracks per decision (decision quality metric)
+        solver_stats = agg_all.loc[dataset].dropna(subset=['bpd_med']).sort_values('bpd_med')
         
         x = range(len(solver_stats))
-        colors = [SOLVER_COLORS.get(s, '#666666') for s in solver_stats['solver']]
+        colors = [SOLVER_COLORS.get(s, '#666666') for s in solver_stats.index]
         
         # Create bar plot
-        bars = ax.bar(x, solver_stats['median_bpd'], alpha=0.8, color=colors,
+        bars = ax.bar(x, solver_stats['bpd_med'], alpha=0.8, color=colors,
                      edgecolor='black', linewidth=0.5)
         
         # Highlight good performers (low backtracks per decision)
-        for i, (bar, val) in enumerate(zip(bars, solver_stats['median_bpd'])):
+        for i, (bar, val) in enumerate(zip(bars, solver_stats['bpd_med'])):
             if val < 1.0:  # Good: fewer backtracks than decisions
                 bar.set_edgecolor('green')
                 bar.set_linewidth(2)
@@ -144,35 +177,29 @@ def plot_a2_decision_quality(df):
         ax.axhline(y=1.0, color='red', linestyle='--', linewidth=1.5, alpha=0.7, label='1:1 Ratio')
         
         ax.set_xticks(x)
-        ax.set_xticklabels(solver_stats['solver'], rotation=45, ha='right')
+        ax.set_xticklabels(solver_stats.index, rotation=45, ha='right')
         ax.set_ylabel('Backtracks per Decision')
         ax.set_title(dataset, fontweight='bold')
         ax.legend()
         ax.grid(True, alpha=0.3, axis='y')
     
     plt.suptitle('Decision Quality: Backtracks per Decision (Lower is Better)', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A02_decision_quality.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A02_decision_quality.png')
     plt.close()
     print("  ✓ Saved: A02_decision_quality.png")
 
-def plot_a3_scalability_analysis(df):
+def plot_a3_scalability_analysis(agg_all, df_by_ds):
     """Plot A3: Scalability - How solvers scale with problem size"""
     print("\nGenerating Advanced Plot A3: Scalability Analysis...")
     
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
     
-    # Calculate median time for each solver-dataset combination
-    scalability_data = df.groupby(['solver', 'num_vars']).agg({
-        'time_seconds': 'median',
-        'solver_name': 'first'
-    }).reset_index()
+    # Median time for each solver-dataset combination, in problem-size order
+    scalability_data = agg_all.reset_index().sort_values(['solver', 'num_vars'])
     
     # Plot lines for each solver
-    for solver in sorted(scalability_data['solver'].unique()):
-        solver_data = scalability_data[scalability_data['solver'] == solver]
-        
-        ax.plot(solver_data['num_vars'], solver_data['time_seconds'],
+    for solver, solver_data in scalability_data.groupby('solver', observed=True):
+        ax.plot(solver_data['num_vars'], solver_data['time_med'],
                marker='o', markersize=8, linewidth=2.5, alpha=0.8,
                label=solver_data['solver_name'].iloc[0],
                color=SOLVER_COLORS.get(solver, '#666666'))
@@ -185,31 +212,28 @@ def plot_a3_scalability_analysis(df):
     ax.legend(loc='best', ncol=2, framealpha=0.9)
     ax.grid(True, alpha=0.3, linestyle='--')
     
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A03_scalability_analysis.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A03_scalability_analysis.png')
     plt.close()
     print("  ✓ Saved: A03_scalability_analysis.png")
 
-def plot_a4_performance_distribution(df):
+def plot_a4_performance_distribution(agg_all, df_by_ds):
     """Plot A4: Performance Distribution - Violin plots showing variance"""
     print("\nGenerating Advanced Plot A4: Performance Distribution...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 6), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset]
+        dataset_data = df_by_ds[dataset]
         
         # Prepare data for violin plot
-        solvers_ordered = dataset_data.groupby('solver')['time_seconds'].median().sort_values().index
+        solvers_ordered = agg_all.loc[dataset, 'time_med'].sort_values().index
         
-        plot_data = []
-        positions = []
-        for i, solver in enumerate(solvers_ordered):
-            solver_times = dataset_data[dataset_data['solver'] == solver]['time_seconds'].values
-            plot_data.append(solver_times)
-            positions.append(i)
+        by_solver = {solver: times.to_numpy() for solver, times
+                     in dataset_data.groupby('solver', observed=True, sort=False)['time_seconds']}
+        plot_data = [by_solver[solver] for solver in solvers_ordered]
+        positions = list(range(len(solvers_ordered)))
         
         # Create violin plot
         parts = ax.violinplot(plot_data, positions=positions, widths=0.7, showmeans=True, showmedians=True)
@@ -228,33 +252,27 @@ def plot_a4_performance_distribution(df):
         ax.grid(True, alpha=0.3, axis='y')
     
     plt.suptitle('Performance Distribution: Time Variance Across Instances', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A04_performance_distribution.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A04_performance_distribution.png')
     plt.close()
     print("  ✓ Saved: A04_performance_distribution.png")
 
-def plot_a5_heatmap_solver_comparison(df):
+def plot_a5_heatmap_solver_comparison(agg_all, df_by_ds):
     """Plot A5: Heatmap - Pairwise solver comparison"""
     print("\nGenerating Advanced Plot A5: Solver Comparison Heatmap...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(20, 6))
+    fig, axes = plt.subplots(1, 3, figsize=(20, 6), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset]
         
-        # Create pivot table of median times
-        solver_times = dataset_data.groupby('solver')['time_seconds'].median().sort_values()
+        # Median time per solver, fastest first
+        solver_times = agg_all.loc[dataset, 'time_med'].sort_values()
         solvers = solver_times.index.tolist()
         
-        # Calculate speedup matrix
-        speedup_matrix = np.zeros((len(solvers), len(solvers)))
-        for i, solver_i in enumerate(solvers):
-            for j, solver_j in enumerate(solvers):
-                time_i = solver_times[solver_i]
-                time_j = solver_times[solver_j]
-                speedup_matrix[i, j] = time_j / time_i  # How much faster is i compared to j
+        # Calculate speedup matrix: [i, j] is how much faster i is compared to j
+        times = solver_times.to_numpy(dtype=np.float64)
+        speedup_matrix = times[np.newaxis, :] / times[:, np.newaxis]
         
         # Create heatmap
         im = ax.imshow(speedup_matrix, cmap='RdYlGn', aspect='auto', vmin=0.5, vmax=2.0)
@@ -276,38 +294,35 @@ def plot_a5_heatmap_solver_comparison(df):
                              ha="center", va="center", color="black", fontsize=6)
     
     plt.suptitle('Pairwise Speedup Comparison (Row/Column Ratio)', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A05_solver_comparison_heatmap.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A05_solver_comparison_heatmap.png')
     plt.close()
     print("  ✓ Saved: A05_solver_comparison_heatmap.png")
 
-def plot_a6_efficiency_frontier(df):
+def plot_a6_efficiency_frontier(agg_all, df_by_ds):
     """Plot A6: Pareto Frontier - Time vs Decisions trade-off"""
     print("\nGenerating Advanced Plot A6: Efficiency Frontier...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 5), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset]
         
-        # Calculate median decisions and time per solver
-        solver_stats = dataset_data.groupby('solver').agg({
-            'num_decisions': 'median',
-            'time_seconds': 'median',
-            'solver_name': 'first'
-        }).reset_index()
+        # Median decisions and time per solver, drawn in name order
+        solver_stats = agg_all.loc[dataset].sort_index()
+        solvers = solver_stats.index.tolist()
+        decisions = solver_stats['dec_med'].to_numpy()
+        times = solver_stats['time_med'].to_numpy()
         
         # Scatter plot
-        for _, row in solver_stats.iterrows():
-            ax.scatter(row['num_decisions'], row['time_seconds'],
-                      s=200, alpha=0.7, color=SOLVER_COLORS.get(row['solver'], '#666666'),
-                      edgecolors='black', linewidth=1.5, zorder=3)
-            
-            # Add labels
-            ax.annotate(row['solver'], 
-                       xy=(row['num_decisions'], row['time_seconds']),
+        ax.scatter(decisions, times,
+                  s=200, alpha=0.7, color=[SOLVER_COLORS.get(s, '#666666') for s in solvers],
+                  edgecolors='black', linewidth=1.5, zorder=3)
+        
+        # Add labels
+        for solver, x, y in zip(solvers, decisions, times):
+            ax.annotate(solver, 
+                       xy=(x, y),
                        xytext=(5, 5), textcoords='offset points',
                        fontsize=7, alpha=0.8)
         
@@ -322,34 +337,27 @@ def plot_a6_efficiency_frontier(df):
         ax.plot([1, 10000], [1e-4, 100], 'k--', alpha=0.2, linewidth=1, label='Reference')
     
     plt.suptitle('Efficiency Frontier: Decision Count vs. Execution Time', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A06_efficiency_frontier.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A06_efficiency_frontier.png')
     plt.close()
     print("  ✓ Saved: A06_efficiency_frontier.png")
 
-def plot_a7_variance_analysis(df):
+def plot_a7_variance_analysis(agg_all, df_by_ds):
     """Plot A7: Performance Variance - Coefficient of Variation"""
     print("\nGenerating Advanced Plot A7: Performance Variance...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 5), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset]
         
         # Calculate coefficient of variation (CV = std/mean)
-        solver_stats = dataset_data.groupby('solver').agg({
-            'time_seconds': ['mean', 'std'],
-            'solver_name': 'first'
-        }).reset_index()
-        
-        solver_stats.columns = ['solver', 'mean_time', 'std_time', 'solver_name']
-        solver_stats['cv'] = solver_stats['std_time'] / solver_stats['mean_time']
+        solver_stats = agg_all.loc[dataset]
+        solver_stats = solver_stats.assign(cv=solver_stats['time_std'] / solver_stats['time_mean'])
         solver_stats = solver_stats.sort_values('cv')
         
         x = range(len(solver_stats))
-        colors = [SOLVER_COLORS.get(s, '#666666') for s in solver_stats['solver']]
+        colors = [SOLVER_COLORS.get(s, '#666666') for s in solver_stats.index]
         
         bars = ax.bar(x, solver_stats['cv'] * 100, alpha=0.8, color=colors,
                      edgecolor='black', linewidth=0.5)
@@ -361,7 +369,7 @@ def plot_a7_variance_analysis(df):
                 bar.set_linewidth(2)
         
         ax.set_xticks(x)
-        ax.set_xticklabels(solver_stats['solver'], rotation=45, ha='right')
+        ax.set_xticklabels(solver_stats.index, rotation=45, ha='right')
         ax.set_ylabel('Coefficient of Variation (%)')
         ax.set_title(dataset, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
@@ -372,21 +380,20 @@ def plot_a7_variance_analysis(df):
     
     plt.suptitle('Performance Consistency: Coefficient of Variation (Lower = More Consistent)', 
                  fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A07_variance_analysis.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A07_variance_analysis.png')
     plt.close()
     print("  ✓ Saved: A07_variance_analysis.png")
 
-def plot_a8_correlation_matrix(df):
+def plot_a8_correlation_matrix(agg_all, df_by_ds):
     """Plot A8: Correlation Matrix - Between performance metrics"""
     print("\nGenerating Advanced Plot A8: Metric Correlation Matrix...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 5), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset]
+        dataset_data = df_by_ds[dataset]
         
         # Select metrics for correlation
         metrics = dataset_data[['time_seconds', 'num_decisions', 'num_backtracks', 'memory_kb']]
@@ -417,25 +424,25 @@ def plot_a8_correlation_matrix(df):
                              fontsize=10, fontweight='bold')
     
     plt.suptitle('Performance Metrics Correlation Matrix', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A08_correlation_matrix.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A08_correlation_matrix.png')
     plt.close()
     print("  ✓ Saved: A08_correlation_matrix.png")
 
-def plot_a9_winner_analysis(df):
+def plot_a9_winner_analysis(agg_all, df_by_ds):
     """Plot A9: Instance-wise Winner Analysis"""
     print("\nGenerating Advanced Plot A9: Winner Analysis...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 6), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset]
+        dataset_data = df_by_ds[dataset]
         
         # Find winner (fastest) for each instance
-        winners = dataset_data.loc[dataset_data.groupby('instance')['time_seconds'].idxmin()]
-        winner_counts = winners['solver'].value_counts()
+        winners = dataset_data.groupby('instance', sort=False)['time_seconds'].idxmin()
+        winner_counts = dataset_data.loc[winners, 'solver'].value_counts()
+        winner_counts = winner_counts[winner_counts > 0]  # categorical counts include non-winners
         
         # Create pie chart
         colors = [SOLVER_COLORS.get(s, '#666666') for s in winner_counts.index]
@@ -457,31 +464,28 @@ def plot_a9_winner_analysis(df):
     
     plt.suptitle('Instance-wise Winner Analysis: Which Solver is Fastest Most Often?', 
                  fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A09_winner_analysis.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A09_winner_analysis.png')
     plt.close()
     print("  ✓ Saved: A09_winner_analysis.png")
 
-def plot_a10_performance_percentiles(df):
+def plot_a10_performance_percentiles(agg_all, df_by_ds):
     """Plot A10: Performance Percentiles - Box plots"""
     print("\nGenerating Advanced Plot A10: Performance Percentiles...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    fig, axes = plt.subplots(1, 3, figsize=(18, 6), layout='constrained')
     datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
     
     for idx, dataset in enumerate(datasets):
         ax = axes[idx]
-        dataset_data = df[df['dataset'] == dataset]
+        dataset_data = df_by_ds[dataset]
         
         # Prepare data for box plot
-        solvers_ordered = dataset_data.groupby('solver')['time_seconds'].median().sort_values().index
+        solvers_ordered = agg_all.loc[dataset, 'time_med'].sort_values().index
         
-        plot_data = []
-        positions = []
-        for i, solver in enumerate(solvers_ordered):
-            solver_times = dataset_data[dataset_data['solver'] == solver]['time_seconds'].values
-            plot_data.append(solver_times)
-            positions.append(i)
+        by_solver = {solver: times.to_numpy() for solver, times
+                     in dataset_data.groupby('solver', observed=True, sort=False)['time_seconds']}
+        plot_data = [by_solver[solver] for solver in solvers_ordered]
+        positions = list(range(len(solvers_ordered)))
         
         # Create box plot
         bp = ax.boxplot(plot_data, positions=positions, widths=0.6, patch_artist=True,
@@ -500,8 +504,7 @@ def plot_a10_performance_percentiles(df):
         ax.grid(True, alpha=0.3, axis='y')
     
     plt.suptitle('Performance Percentiles: Distribution with Outliers', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/advanced/A10_performance_percentiles.png', dpi=300, bbox_inches='tight')
+    plt.savefig('results/plots/advanced/A10_performance_percentiles.png')
     plt.close()
     print("  ✓ Saved: A10_performance_percentiles.png")
 
@@ -517,17 +520,31 @@ def main():
     # Load data
     df = load_data()
     
-    # Generate advanced plots
-    plot_a1_backtrack_efficiency(df)
-    plot_a2_decision_quality(df)
-    plot_a3_scalability_analysis(df)
-    plot_a4_performance_distribution(df)
-    plot_a5_heatmap_solver_comparison(df)
-    plot_a6_efficiency_frontier(df)
-    plot_a7_variance_analysis(df)
-    plot_a8_correlation_matrix(df)
-    plot_a9_winner_analysis(df)
-    plot_a10_performance_percentiles(df)
+    # Split and aggregate once; every plot reads from these. The per-dataset
+    # frames keep only the raw columns A4/A8/A9/A10 read, since each plot
+    # process receives its own copy, and the full frame is dropped after that
+    agg_all = summarize_solvers(df)
+    raw_cols = ['instance', 'solver', 'time_seconds', 'num_decisions', 'num_backtracks', 'memory_kb']
+    df_by_ds = dict(tuple(df[raw_cols].groupby(df['dataset'], observed=True, sort=False)))
+    del df
+    
+    # Generate advanced plots. Each one is an independent figure and rendering is
+    # CPU-bound, so they are spread over worker processes
+    plots = [
+        plot_a1_backtrack_efficiency,
+        plot_a2_decision_quality,
+        plot_a3_scalability_analysis,
+        plot_a4_performance_distribution,
+        plot_a5_heatmap_solver_comparison,
+        plot_a6_efficiency_frontier,
+        plot_a7_variance_analysis,
+        plot_a8_correlation_matrix,
+        plot_a9_winner_analysis,
+        plot_a10_performance_percentiles,
+    ]
+    with ProcessPoolExecutor(max_workers=min(len(plots), os.cpu_count() or 1)) as pool:
+        for future in [pool.submit(plot, agg_all, df_by_ds) for plot in plots]:
+            future.result()
     
     print("\n" + "=" * 80)
     print("Advanced Analysis Complete!")
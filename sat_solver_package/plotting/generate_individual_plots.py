@@ -4,8 +4,14 @@ Generate Individual Plots for Each Solver
 Creates separate high-quality plots for time and memory per solver
 """
 
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # plots are only written to files; no GUI backend needed
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 import numpy as np
 from pathlib import Path
@@ -33,6 +39,9 @@ plt.rcParams['lines.markersize'] = 4
 plt.rcParams['axes.grid'] = True
 plt.rcParams['grid.alpha'] = 0.3
 
+# Datasets in plotting order
+DATASETS = ('UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)')
+
 # Color scheme for datasets
 DATASET_COLORS = {
     'UF20 (20 vars)': '#2E86AB',    # Blue
@@ -47,13 +56,35 @@ DATASET_MARKERS = {
     'UF100 (100 vars)': '^'
 }
 
+# (dataset, color, marker) for every line drawn per solver
+DATASET_STYLE = tuple((d, DATASET_COLORS[d], DATASET_MARKERS[d]) for d in DATASETS)
+
+def _cached_frame(path_csv):
+    """pd.read_csv with an on-disk cache, reused while it is newer than the CSV"""
+    cache = os.path.join(os.path.dirname(path_csv), '_cache', os.path.basename(path_csv) + '.pkl')
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(path_csv):
+            return pd.read_pickle(cache)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # missing, stale or unreadable cache: parse again
+    
+    df = pd.read_csv(path_csv)
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        df.to_pickle(cache)
+    except OSError:
+        pass  # read-only results folder: just skip caching
+    return df
+
 def load_data():
     """Load all benchmark data"""
     print("Loading benchmark data...")
     
-    uf20 = pd.read_csv('results/uf20_benchmark.csv')
-    uf50 = pd.read_csv('results/uf50_benchmark.csv')
-    uf100 = pd.read_csv('results/uf100_benchmark.csv')
+    # Parse the three CSVs side by side; pandas' C parser releases the GIL
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        uf20, uf50, uf100 = pool.map(_cached_frame, ['results/uf20_benchmark.csv',
+                                                     'results/uf50_benchmark.csv',
+                                                     'results/uf100_benchmark.csv'])
     
     # Add dataset identifier
     uf20['dataset'] = 'UF20 (20 vars)'
@@ -77,17 +108,18 @@ def load_data():
     
     return df
 
-def plot_individual_time(df, solver, solver_name, output_dir):
-    """Create individual time plot for a solver"""
+def plot_individual_time(solver_data, solver, solver_name, output_dir):
+    """Create individual time plot for a solver from its rows, sorted by instance"""
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
     
-    solver_data = df[df['solver'] == solver].copy()
+    by_dataset = dict(tuple(solver_data.groupby('dataset', sort=False)))
     
-    for dataset in ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']:
-        dataset_data = solver_data[solver_data['dataset'] == dataset].sort_values('instance')
-        
-        if len(dataset_data) > 0:
+    for dataset, color, marker in DATASET_STYLE:
+        if dataset in by_dataset:
+            dataset_data = by_dataset[dataset]
+            
             # Use instance index for x-axis
             x = range(len(dataset_data))
             y = dataset_data['time_seconds'].values
@@ -97,10 +129,10 @@ def plot_individual_time(df, solver, solver_name, output_dir):
                    label=dataset, 
                    alpha=0.8, 
                    linewidth=2,
-                   marker=DATASET_MARKERS[dataset],
+                   marker=marker,
                    markersize=3,
                    markevery=max(1, len(x) // 30),  # Show ~30 markers
-                   color=DATASET_COLORS[dataset])
+                   color=color)
     
     ax.set_title(f'{solver_name}', fontweight='bold', fontsize=14)
     ax.set_xlabel('Instance Index', fontsize=12)
@@ -110,12 +142,10 @@ def plot_individual_time(df, solver, solver_name, output_dir):
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # Add statistics box
-    stats_text = []
-    for dataset in ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']:
-        dataset_data = solver_data[solver_data['dataset'] == dataset]
-        if len(dataset_data) > 0:
-            median_time = dataset_data['time_seconds'].median()
-            stats_text.append(f"{dataset.split()[0]}: {median_time:.4f}s")
+    medians = solver_data.groupby('dataset', sort=False)['time_seconds'].median()
+    stats_text = [f"{dataset.split()[0]}: {medians[dataset]:.4f}s"
+                  for dataset in DATASETS
+                  if dataset in medians]
     
     if stats_text:
         textstr = 'Median Times:\n' + '\n'.join(stats_text)
@@ -123,21 +153,21 @@ def plot_individual_time(df, solver, solver_name, output_dir):
         ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=9,
                verticalalignment='top', bbox=props)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/time_{solver}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{output_dir}/time_{solver}.png', dpi=300, bbox_inches='tight')
 
-def plot_individual_memory(df, solver, solver_name, output_dir):
-    """Create individual memory plot for a solver"""
+def plot_individual_memory(solver_data, solver, solver_name, output_dir):
+    """Create individual memory plot for a solver from its rows, sorted by instance"""
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
     
-    solver_data = df[df['solver'] == solver].copy()
+    by_dataset = dict(tuple(solver_data.groupby('dataset', sort=False)))
     
-    for dataset in ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']:
-        dataset_data = solver_data[solver_data['dataset'] == dataset].sort_values('instance')
-        
-        if len(dataset_data) > 0:
+    for dataset, color, marker in DATASET_STYLE:
+        if dataset in by_dataset:
+            dataset_data = by_dataset[dataset]
+            
             x = range(len(dataset_data))
             y = dataset_data['memory_kb'].values
             
@@ -146,10 +176,10 @@ def plot_individual_memory(df, solver, solver_name, output_dir):
                    label=dataset, 
                    alpha=0.8, 
                    linewidth=2,
-                   marker=DATASET_MARKERS[dataset],
+                   marker=marker,
                    markersize=3,
                    markevery=max(1, len(x) // 30),  # Show ~30 markers
-                   color=DATASET_COLORS[dataset])
+                   color=color)
     
     ax.set_title(f'{solver_name}', fontweight='bold', fontsize=14)
     ax.set_xlabel('Instance Index', fontsize=12)
@@ -158,12 +188,10 @@ def plot_individual_memory(df, solver, solver_name, output_dir):
     ax.grid(True, alpha=0.3, linestyle='--')
     
     # Add statistics box
-    stats_text = []
-    for dataset in ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']:
-        dataset_data = solver_data[solver_data['dataset'] == dataset]
-        if len(dataset_data) > 0:
-            median_mem = dataset_data['memory_kb'].median()
-            stats_text.append(f"{dataset.split()[0]}: {median_mem:.0f} KB")
+    medians = solver_data.groupby('dataset', sort=False)['memory_kb'].median()
+    stats_text = [f"{dataset.split()[0]}: {medians[dataset]:.0f} KB"
+                  for dataset in DATASETS
+                  if dataset in medians]
     
     if stats_text:
         textstr = 'Median Memory:\n' + '\n'.join(stats_text)
@@ -171,9 +199,8 @@ def plot_individual_memory(df, solver, solver_name, output_dir):
         ax.text(0.02, 0.98, textstr, transform=ax.transAxes, fontsize=9,
                verticalalignment='top', bbox=props)
     
-    plt.tight_layout()
-    plt.savefig(f'{output_dir}/memory_{solver}.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f'{output_dir}/memory_{solver}.png', dpi=300, bbox_inches='tight')
 
 def main():
     """Main function to generate individual plots"""
@@ -190,26 +217,32 @@ def main():
     # Load data
     df = load_data()
     
-    # Get unique solvers
-    solvers = sorted(df['solver'].unique())
+    # Sort once and split by solver; each plot only sees its own solver's rows
+    by_solver = list(df.sort_values(['solver', 'dataset', 'instance']).groupby('solver'))
+    solvers = [solver for solver, _ in by_solver]
     solver_names = df.groupby('solver')['solver_name'].first()
     
     print(f"\nGenerating individual plots for {len(solvers)} solvers...")
     print("-" * 80)
     
-    # Generate plots for each solver
-    for idx, solver in enumerate(solvers, 1):
-        solver_name = solver_names[solver]
-        
-        print(f"[{idx}/{len(solvers)}] {solver_name}")
+    # Generate plots for each solver. Every plot is an independent figure, so they
+    # are rendered in worker processes; progress is still reported in solver order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        runs = [(solver,
+                 pool.submit(plot_individual_time, solver_data, solver, solver_names[solver], time_dir),
+                 pool.submit(plot_individual_memory, solver_data, solver, solver_names[solver], memory_dir))
+                for solver, solver_data in by_solver]
         
-        # Time plot
-        plot_individual_time(df, solver, solver_name, time_dir)
-        print(f"  ✓ Time plot: individual_time/time_{solver}.png")
-        
-        # Memory plot
-        plot_individual_memory(df, solver, solver_name, memory_dir)
-        print(f"  ✓ Memory plot: individual_memory/memory_{solver}.png")
+        for idx, (solver, time_plot, memory_plot) in enumerate(runs, 1):
+            print(f"[{idx}/{len(solvers)}] {solver_names[solver]}")
+            
+            # Time plot
+            time_plot.result()
+            print(f"  ✓ Time plot: individual_time/time_{solver}.png")
+            
+            # Memory plot
+            memory_plot.result()
+            print(f"  ✓ Memory plot: individual_memory/memory_{solver}.png")
     
     print("\n" + "=" * 80)
     print("All individual plots generated successfully!")
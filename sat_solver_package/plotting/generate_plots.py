@@ -17,12 +17,18 @@ Date: December 2025
 Requirements: pandas, matplotlib, seaborn, numpy
 """
 
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # plots are only written to files; no GUI backend needed
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import seaborn as sns
 import numpy as np
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -46,6 +52,9 @@ plt.rcParams['lines.linewidth'] = 1.5
 plt.rcParams['axes.grid'] = True
 plt.rcParams['grid.alpha'] = 0.3
 
+# Datasets in plotting order
+DATASETS = ('UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)')
+
 # Color scheme for solvers
 SOLVER_COLORS = {
     'basic_dpll': '#1f77b4',
@@ -61,16 +70,34 @@ SOLVER_COLORS = {
     'cdcl_solver': '#ff1493'  # Hot pink for CDCL to stand out
 }
 
-def load_data() -> pd.DataFrame:
+def _cached_frame(path_csv: str) -> pd.DataFrame:
+    """pd.read_csv with an on-disk cache, reused while it is newer than the CSV"""
+    cache = os.path.join(os.path.dirname(path_csv), '_cache', os.path.basename(path_csv) + '.pkl')
+    try:
+        if os.path.getmtime(cache) >= os.path.getmtime(path_csv):
+            return pd.read_pickle(cache)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass  # missing, stale or unreadable cache: parse again
+    
+    df = pd.read_csv(path_csv)
+    try:
+        os.makedirs(os.path.dirname(cache), exist_ok=True)
+        df.to_pickle(cache)
+    except OSError:
+        pass  # read-only results folder: just skip caching
+    return df
+
+def load_data() -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Load and combine benchmark results from all three SATLIB datasets.
     
     This function reads CSV files for UF20, UF50, and UF100 benchmarks,
-    adds dataset identifiers, filters out timeouts and errors, and
-    combines them into a single DataFrame for analysis.
+    adds dataset identifiers and combines them into a single DataFrame.
+    The combined frame is returned both as-is and with timeouts and
+    errors filtered out, so success rates need no second read.
     
     Returns:
-        pd.DataFrame: Combined benchmark data with columns:
+        Tuple[pd.DataFrame, pd.DataFrame]: (all runs, successful runs), with columns:
             - instance (str): CNF filename
             - solver (str): Solver identifier (e.g., 'vsids', 'cdcl_solver')
             - solver_name (str): Human-readable solver name
@@ -84,19 +111,21 @@ def load_data() -> pd.DataFrame:
             - dataset (str): Dataset identifier with variable count
             - num_vars (int): Number of variables (20, 50, or 100)
     
-    Filters:
+    Filters (successful runs only):
         - Excludes timeout instances (timeout == 1)
         - Excludes error results (result not in ['SAT', 'UNSAT'])
     
     Example:
-        df = load_data()
+        df_all, df = load_data()
         print(df.groupby('solver')['time_seconds'].median())
     """
     print("Loading benchmark data...")
     
-    uf20 = pd.read_csv('results/uf20_benchmark.csv')
-    uf50 = pd.read_csv('results/uf50_benchmark.csv')
-    uf100 = pd.read_csv('results/uf100_benchmark.csv')
+    # Parse the three CSVs side by side; pandas' C parser releases the GIL
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        uf20, uf50, uf100 = pool.map(_cached_frame, ['results/uf20_benchmark.csv',
+                                                     'results/uf50_benchmark.csv',
+                                                     'results/uf100_benchmark.csv'])
     
     # Add dataset identifier
     uf20['dataset'] = 'UF20 (20 vars)'
@@ -109,19 +138,18 @@ def load_data() -> pd.DataFrame:
     uf100['num_vars'] = 100
     
     # Combine all data
-    df = pd.concat([uf20, uf50, uf100], ignore_index=True)
+    df_all = pd.concat([uf20, uf50, uf100], ignore_index=True)
     
     # Convert time to float and filter out timeouts/errors
-    df['time_seconds'] = pd.to_numeric(df['time_seconds'], errors='coerce')
-    df = df[df['timeout'] == 0]
-    df = df[df['result'].isin(['SAT', 'UNSAT'])]
+    df_all['time_seconds'] = pd.to_numeric(df_all['time_seconds'], errors='coerce')
+    df = df_all[(df_all['timeout'] == 0) & df_all['result'].isin(['SAT', 'UNSAT'])]
     
     print(f"Loaded {len(df)} results")
     print(f"  UF20: {len(uf20)} results")
     print(f"  UF50: {len(uf50)} results")
     print(f"  UF100: {len(uf100)} results")
     
-    return df
+    return df_all, df
 
 def plot1_time_per_heuristic(df: pd.DataFrame) -> None:
     """
@@ -132,7 +160,7 @@ def plot1_time_per_heuristic(df: pd.DataFrame) -> None:
     performance with different colored lines for each dataset.
     
     Args:
-        df (pd.DataFrame): Combined benchmark data from load_data()
+        df (pd.DataFrame): Successful runs from load_data()
     
     Output:
         Saves to 'results/plots/01_time_per_heuristic.png' (300 DPI)
@@ -150,19 +178,21 @@ def plot1_time_per_heuristic(df: pd.DataFrame) -> None:
     """
     print("\nGenerating Plot 1: Time per heuristic across datasets...")
     
-    fig, axes = plt.subplots(3, 4, figsize=(16, 12))
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(3, 4)
     axes = axes.flatten()
     
-    solvers = df['solver'].unique()
+    # Sort once and partition by solver, then dataset, instead of masking per line
+    by_solver = list(df.sort_values(['solver', 'dataset', 'instance']).groupby('solver'))
     
-    for idx, solver in enumerate(sorted(solvers)):
+    for idx, (solver, solver_data) in enumerate(by_solver):
         ax = axes[idx]
-        solver_data = df[df['solver'] == solver].copy()
+        by_dataset = dict(tuple(solver_data.groupby('dataset', sort=False)))
         
-        for dataset in ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']:
-            dataset_data = solver_data[solver_data['dataset'] == dataset].sort_values('instance')
-            
-            if len(dataset_data) > 0:
+        for dataset in DATASETS:
+            if dataset in by_dataset:
+                dataset_data = by_dataset[dataset]
+                
                 # Use instance index for x-axis
                 x = range(len(dataset_data))
                 y = dataset_data['time_seconds'].values
@@ -177,33 +207,35 @@ def plot1_time_per_heuristic(df: pd.DataFrame) -> None:
         ax.grid(True, alpha=0.3)
     
     # Hide extra subplots if any
-    for idx in range(len(solvers), len(axes)):
+    for idx in range(len(by_solver), len(axes)):
         axes[idx].axis('off')
     
-    plt.suptitle('Execution Time per Solver Across Problem Sizes', fontsize=14, fontweight='bold', y=0.995)
-    plt.tight_layout()
-    plt.savefig('results/plots/01_time_per_heuristic.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Execution Time per Solver Across Problem Sizes', fontsize=14, fontweight='bold', y=0.995)
+    fig.tight_layout()
+    fig.savefig('results/plots/01_time_per_heuristic.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/01_time_per_heuristic.png")
 
 def plot2_memory_per_heuristic(df):
     """Plot 2: Memory usage per heuristic across all datasets"""
     print("\nGenerating Plot 2: Memory per heuristic across datasets...")
     
-    fig, axes = plt.subplots(3, 4, figsize=(16, 12))
+    fig = Figure(figsize=(16, 12))
+    axes = fig.subplots(3, 4)
     axes = axes.flatten()
     
     # Exclude CDCL from this plot because memory is not instrumented for the C++ binary
-    solvers = [s for s in sorted(df['solver'].unique()) if s != 'cdcl_solver']
+    by_solver = [(solver, solver_data) for solver, solver_data
+                 in df.sort_values(['solver', 'dataset', 'instance']).groupby('solver')
+                 if solver != 'cdcl_solver']
     
-    for idx, solver in enumerate(solvers):
+    for idx, (solver, solver_data) in enumerate(by_solver):
         ax = axes[idx]
-        solver_data = df[df['solver'] == solver].copy()
+        by_dataset = dict(tuple(solver_data.groupby('dataset', sort=False)))
         
-        for dataset in ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']:
-            dataset_data = solver_data[solver_data['dataset'] == dataset].sort_values('instance')
-            
-            if len(dataset_data) > 0:
+        for dataset in DATASETS:
+            if dataset in by_dataset:
+                dataset_data = by_dataset[dataset]
+                
                 x = range(len(dataset_data))
                 y = dataset_data['memory_kb'].values
                 
@@ -216,24 +248,22 @@ def plot2_memory_per_heuristic(df):
         ax.grid(True, alpha=0.3)
     
     # Hide extra subplots
-    for idx in range(len(solvers), len(axes)):
+    for idx in range(len(by_solver), len(axes)):
         axes[idx].axis('off')
     
-    plt.suptitle('Memory Usage per Solver Across Problem Sizes', fontsize=14, fontweight='bold', y=0.995)
-    plt.tight_layout()
-    plt.savefig('results/plots/02_memory_per_heuristic.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Memory Usage per Solver Across Problem Sizes', fontsize=14, fontweight='bold', y=0.995)
+    fig.tight_layout()
+    fig.savefig('results/plots/02_memory_per_heuristic.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/02_memory_per_heuristic.png")
 
 def plot3_time_comparison_per_dataset(df):
     """Plot 3: Time comparison for each dataset"""
     print("\nGenerating Plot 3: Time comparison per dataset...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
-    
-    datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
+    fig = Figure(figsize=(18, 5))
+    axes = fig.subplots(1, 3)
     
-    for idx, dataset in enumerate(datasets):
+    for idx, dataset in enumerate(DATASETS):
         ax = axes[idx]
         dataset_data = df[df['dataset'] == dataset]
         
@@ -260,21 +290,19 @@ def plot3_time_comparison_per_dataset(df):
         ax.set_yscale('log')
         ax.grid(True, alpha=0.3, axis='y')
     
-    plt.suptitle('Solver Performance Comparison by Problem Size', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/03_time_comparison_per_dataset.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Solver Performance Comparison by Problem Size', fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('results/plots/03_time_comparison_per_dataset.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/03_time_comparison_per_dataset.png")
 
 def plot4_memory_comparison_per_dataset(df):
     """Plot 4: Memory comparison for each dataset"""
     print("\nGenerating Plot 4: Memory comparison per dataset...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+    fig = Figure(figsize=(18, 5))
+    axes = fig.subplots(1, 3)
     
-    datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
-    
-    for idx, dataset in enumerate(datasets):
+    for idx, dataset in enumerate(DATASETS):
         ax = axes[idx]
         dataset_data = df[df['dataset'] == dataset]
         
@@ -299,21 +327,19 @@ def plot4_memory_comparison_per_dataset(df):
         ax.set_title(dataset, fontweight='bold')
         ax.grid(True, alpha=0.3, axis='y')
     
-    plt.suptitle('Memory Usage Comparison by Problem Size', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/04_memory_comparison_per_dataset.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Memory Usage Comparison by Problem Size', fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('results/plots/04_memory_comparison_per_dataset.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/04_memory_comparison_per_dataset.png")
 
 def plot5_decisions_scatter(df):
     """Plot 5: Decisions required scatter plot"""
     print("\nGenerating Plot 5: Decisions scatter plot...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
-    
-    datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
+    fig = Figure(figsize=(18, 5))
+    axes = fig.subplots(1, 3)
     
-    for idx, dataset in enumerate(datasets):
+    for idx, dataset in enumerate(DATASETS):
         ax = axes[idx]
         dataset_data = df[df['dataset'] == dataset]
         
@@ -336,42 +362,40 @@ def plot5_decisions_scatter(df):
         ax.legend(loc='best', fontsize=7, ncol=2)
         ax.grid(True, alpha=0.3)
     
-    plt.suptitle('Decisions vs. Time Across Solvers', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/05_decisions_scatter.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Decisions vs. Time Across Solvers', fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('results/plots/05_decisions_scatter.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/05_decisions_scatter.png")
 
 def plot6_time_vs_decisions_correlation(df):
     """Plot 6: Time vs decisions correlation"""
     print("\nGenerating Plot 6: Time vs decisions correlation...")
     
-    fig, axes = plt.subplots(2, 3, figsize=(18, 10))
+    fig = Figure(figsize=(18, 10))
+    axes = fig.subplots(2, 3)
     
     # Select key solvers to highlight
     key_solvers = ['basic_dpll', 'vsids', 'cdcl_solver', 'mom', 'backjumping', 'random']
-    datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
-    
     for row, solver in enumerate(['basic_dpll', 'cdcl_solver']):
-        for col, dataset in enumerate(datasets):
+        for col, dataset in enumerate(DATASETS):
             ax = axes[row, col]
             
             data = df[(df['solver'] == solver) & (df['dataset'] == dataset)]
             
             if len(data) > 0:
+                decisions = data['num_decisions'].to_numpy()
+                times = data['time_seconds'].to_numpy()
+                
                 # Scatter plot
-                ax.scatter(data['num_decisions'], data['time_seconds'], 
+                ax.scatter(decisions, times, 
                           alpha=0.5, s=15, color=SOLVER_COLORS.get(solver, '#666666'))
                 
-                # Add trend line
+                # Add trend line, fitted and evaluated in log space
                 if len(data) > 1:
-                    z = np.polyfit(np.log10(data['num_decisions'] + 1), 
-                                  np.log10(data['time_seconds'] + 1e-6), 1)
+                    z = np.polyfit(np.log10(decisions + 1), np.log10(times + 1e-6), 1)
                     p = np.poly1d(z)
-                    x_trend = np.logspace(np.log10(data['num_decisions'].min()),
-                                         np.log10(data['num_decisions'].max()), 100)
-                    y_trend = 10 ** p(np.log10(x_trend))
-                    ax.plot(x_trend, y_trend, 'r--', linewidth=2, alpha=0.7, label='Trend')
+                    log_trend = np.linspace(np.log10(decisions.min()), np.log10(decisions.max()), 100)
+                    ax.plot(10 ** log_trend, 10 ** p(log_trend), 'r--', linewidth=2, alpha=0.7, label='Trend')
                     
                     # Calculate correlation
                     corr = data['num_decisions'].corr(data['time_seconds'])
@@ -386,21 +410,19 @@ def plot6_time_vs_decisions_correlation(df):
                 ax.grid(True, alpha=0.3)
                 ax.legend(fontsize=8)
     
-    plt.suptitle('Time-Decisions Correlation Analysis', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/06_time_decisions_correlation.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Time-Decisions Correlation Analysis', fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('results/plots/06_time_decisions_correlation.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/06_time_decisions_correlation.png")
 
 def plot7_speedup_relative_to_baseline(df):
     """Plot 7: Speedup relative to baseline (basic_dpll)"""
     print("\nGenerating Plot 7: Speedup relative to baseline...")
     
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
-    
-    datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
+    fig = Figure(figsize=(18, 5))
+    axes = fig.subplots(1, 3)
     
-    for idx, dataset in enumerate(datasets):
+    for idx, dataset in enumerate(DATASETS):
         ax = axes[idx]
         dataset_data = df[df['dataset'] == dataset]
         
@@ -443,52 +465,27 @@ def plot7_speedup_relative_to_baseline(df):
             ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{val:.1f}×', ha='center', va='bottom', fontsize=7)
     
-    plt.suptitle('Speedup Relative to Basic DPLL (Higher is Better)', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/07_speedup_relative_to_baseline.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Speedup Relative to Basic DPLL (Higher is Better)', fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('results/plots/07_speedup_relative_to_baseline.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/07_speedup_relative_to_baseline.png")
 
-def plot8_success_rate(df):
-    """Plot 8: Success rate (non-timeout rate)"""
+def plot8_success_rate(df_all):
+    """Plot 8: Success rate (non-timeout rate), from all runs including timeouts"""
     print("\nGenerating Plot 8: Success rate...")
     
-    # Reload data to include timeouts
-    uf20_all = pd.read_csv('results/uf20_benchmark.csv')
-    uf50_all = pd.read_csv('results/uf50_benchmark.csv')
-    uf100_all = pd.read_csv('results/uf100_benchmark.csv')
-    
-    uf20_all['dataset'] = 'UF20 (20 vars)'
-    uf50_all['dataset'] = 'UF50 (50 vars)'
-    uf100_all['dataset'] = 'UF100 (100 vars)'
-    
-    df_all = pd.concat([uf20_all, uf50_all, uf100_all], ignore_index=True)
-    
-    fig, axes = plt.subplots(1, 3, figsize=(18, 5))
-    
-    datasets = ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']
+    fig = Figure(figsize=(18, 5))
+    axes = fig.subplots(1, 3)
     
-    for idx, dataset in enumerate(datasets):
+    for idx, dataset in enumerate(DATASETS):
         ax = axes[idx]
         dataset_data = df_all[df_all['dataset'] == dataset]
         
-        # Calculate success rate per solver
-        success_rates = []
-        solver_list = []
-        
-        for solver in sorted(dataset_data['solver'].unique()):
-            solver_data = dataset_data[dataset_data['solver'] == solver]
-            total = len(solver_data)
-            successful = len(solver_data[solver_data['timeout'] == 0])
-            success_rate = (successful / total) * 100 if total > 0 else 0
-            
-            success_rates.append(success_rate)
-            solver_list.append(solver)
-        
-        # Sort by success rate
-        sorted_indices = np.argsort(success_rates)[::-1]
-        success_rates = [success_rates[i] for i in sorted_indices]
-        solver_list = [solver_list[i] for i in sorted_indices]
+        # Success rate per solver, highest first (ties stay in alphabetical order)
+        rates = (dataset_data['timeout'].eq(0).groupby(dataset_data['solver']).mean().mul(100)
+                 .sort_values(ascending=False, kind='stable'))
+        success_rates = rates.to_numpy()
+        solver_list = rates.index
         
         x = range(len(success_rates))
         colors = [SOLVER_COLORS.get(s, '#666666') for s in solver_list]
@@ -509,10 +506,9 @@ def plot8_success_rate(df):
             ax.text(bar.get_x() + bar.get_width()/2., val + 1,
                    f'{val:.1f}%', ha='center', va='bottom', fontsize=7)
     
-    plt.suptitle('Solver Success Rate (Non-Timeout)', fontsize=14, fontweight='bold')
-    plt.tight_layout()
-    plt.savefig('results/plots/08_success_rate.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.suptitle('Solver Success Rate (Non-Timeout)', fontsize=14, fontweight='bold')
+    fig.tight_layout()
+    fig.savefig('results/plots/08_success_rate.png', dpi=300, bbox_inches='tight')
     print("  ✓ Saved: results/plots/08_success_rate.png")
 
 def generate_summary_statistics(df):
@@ -521,7 +517,7 @@ def generate_summary_statistics(df):
     
     summary_data = []
     
-    for dataset in ['UF20 (20 vars)', 'UF50 (50 vars)', 'UF100 (100 vars)']:
+    for dataset in DATASETS:
         dataset_data = df[df['dataset'] == dataset]
         
         for solver in sorted(dataset_data['solver'].unique()):
@@ -554,7 +550,7 @@ def main():
     Path('results/plots').mkdir(parents=True, exist_ok=True)
     
     # Load data
-    df = load_data()
+    df_all, df = load_data()
     
     # Generate all plots
     plot1_time_per_heuristic(df)
@@ -564,7 +560,7 @@ def main():
     plot5_decisions_scatter(df)
     plot6_time_vs_decisions_correlation(df)
     plot7_speedup_relative_to_baseline(df)
-    plot8_success_rate(df)
+    plot8_success_rate(df_all)
     
     # Generate summary statistics
     summary = generate_summary_statistics(df)
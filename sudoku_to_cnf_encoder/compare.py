@@ -15,7 +15,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'Sudoku-solver'))
 
 from sudoku_encoder import SudokuToCNF
 from dpll_basic import dpll, stats as dpll_stats
-from sudoku_solver_mrv import solve_sudoku, initialize_domains
+from sudoku_solver_mrv import solve as solve_mrv
 
 class SudokuBenchmarkComparison:
     """Benchmark comparing DPLL-SAT vs MRV Backtracking using Hugging Face API."""
@@ -244,8 +244,7 @@ class SudokuBenchmarkComparison:
             
             start = time.perf_counter()
             try:
-                domains = initialize_domains(board_copy)
-                solved = solve_sudoku(board_copy, domains)
+                solved = solve_mrv(board_copy) is not None
                 end = time.perf_counter()
                 
                 # Get peak memory usage